@@ -26,6 +26,50 @@
 
 import re
 import os.path as op
+from functools import lru_cache
+
+
+LINE_PATTERN = re.compile(r"(?P<mpi>MPI +)?"
+                          r"(?P<ros3>ROS3 +)?"
+                          r"(?P<min_version>[0-9]+\.[0-9]+\.[0-9]+)?"
+                          r"(?:-(?P<max_version>[0-9]+\.[0-9]+\.[0-9]+))? *"
+                          r"(?P<code>(?:unsigned +)?[a-zA-Z_][a-zA-Z0-9_]*\**) +"
+                          r"(?P<fname>[a-zA-Z_][a-zA-Z0-9_]*) *"
+                          r"\((?P<sig>[a-zA-Z0-9_,* ]*)\) *"
+                          r"(?P<nogil>nogil)?")
+
+SIG_PATTERN = re.compile(r"(?:unsigned +)?"
+                         r"[a-zA-Z_][a-zA-Z0-9_]*\** +[ *]*"
+                         r"(?P<param>[a-zA-Z_][a-zA-Z0-9_]*)")
+
+# HDF5 enum types (e.g. H5T_class_t), which signal errors with a negative value
+H5_TYPE_PATTERN = re.compile(r"H5[A-Z]+_[a-zA-Z_]+_t")
+
+# Return types which signal an error with a negative value or with zero
+NEGATIVE_ERROR_TYPES = frozenset(('int', 'herr_t', 'htri_t', 'hid_t', 'hssize_t', 'ssize_t'))
+ZERO_ERROR_TYPES = frozenset(('unsigned int', 'haddr_t', 'hsize_t', 'size_t'))
+
+
+@lru_cache(maxsize=None)
+def error_check(code):
+    """ Return (test, return value) to use for error reporting from a function
+    with return type *code*.  Only a few distinct return types are used, so
+    each is only worked out once.
+    """
+    if '*' in code or code == 'H5T_conv_t':
+        return "==NULL", f"<{code}>NULL"
+    elif code in NEGATIVE_ERROR_TYPES or H5_TYPE_PATTERN.match(code):
+        return "<0", f"<{code}>-1"
+    elif code in ZERO_ERROR_TYPES:
+        return "==0", f"<{code}>0"
+    raise ValueError("Return code <<%s>> unknown" % code)
+
+
+def version_tuple(version):
+    """ Convert "1.10.6" to (1, 10, 6).  None is passed through. """
+    if version is None:
+        return None
+    return tuple(map(int, version.split('.')))
 
 
 class Line(object):
@@ -58,24 +102,8 @@ class Line(object):
         .args:      "a, b"
     """
 
-    PATTERN = re.compile("""(?P<mpi>(MPI)[ ]+)?
-                            (?P<ros3>(ROS3)[ ]+)?
-                            (?P<min_version>([0-9]+\.[0-9]+\.[0-9]+))?
-                            (-(?P<max_version>([0-9]+\.[0-9]+\.[0-9]+)))?
-                            ([ ]+)?
-                            (?P<code>(unsigned[ ]+)?[a-zA-Z_]+[a-zA-Z0-9_]*\**)[ ]+
-                            (?P<fname>[a-zA-Z_]+[a-zA-Z0-9_]*)[ ]*
-                            \((?P<sig>[a-zA-Z0-9_,* ]*)\)
-                            ([ ]+)?
-                            (?P<nogil>(nogil))?
-                            """, re.VERBOSE)
-
-    SIG_PATTERN = re.compile("""
-                             (?:unsigned[ ]+)?
-                             (?:[a-zA-Z_]+[a-zA-Z0-9_]*\**)
-                             [ ]+[ *]*
-                             (?P<param>[a-zA-Z_]+[a-zA-Z0-9_]*)
-                             """, re.VERBOSE)
+    __slots__ = ('nogil', 'mpi', 'ros3', 'min_version', 'max_version', 'code',
+                 'fname', 'sig', 'args', 'err_condition', 'err_value')
 
     def __init__(self, text):
         """ Break the line into pieces and populate object attributes.
@@ -83,7 +111,7 @@ class Line(object):
         text: A valid function line, with leading/trailing whitespace stripped.
         """
 
-        m = self.PATTERN.match(text)
+        m = LINE_PATTERN.match(text)
         if m is None:
             raise ValueError("Invalid line encountered: {0}".format(text))
 
@@ -91,35 +119,19 @@ class Line(object):
         self.nogil = "nogil" if parts['nogil'] else ""
         self.mpi = parts['mpi'] is not None
         self.ros3 = parts['ros3'] is not None
-        self.min_version = parts['min_version']
-        if self.min_version is not None:
-            self.min_version = tuple(int(x) for x in self.min_version.split('.'))
-        self.max_version = parts['max_version']
-        if self.max_version is not None:
-            self.max_version = tuple(int(x) for x in self.max_version.split('.'))
+        self.min_version = version_tuple(parts['min_version'])
+        self.max_version = version_tuple(parts['max_version'])
         self.code = parts['code']
         self.fname = parts['fname']
         self.sig = parts['sig']
 
         sig_const_stripped = self.sig.replace('const', '')
-        self.args = self.SIG_PATTERN.findall(sig_const_stripped)
+        self.args = SIG_PATTERN.findall(sig_const_stripped)
         if self.args is None:
             raise ValueError("Invalid function signature: {0}".format(self.sig))
         self.args = ", ".join(self.args)
 
-        # Figure out what test and return value to use with error reporting
-        if '*' in self.code or self.code in ('H5T_conv_t',):
-            self.err_condition = "==NULL"
-            self.err_value = f"<{self.code}>NULL"
-        elif self.code in ('int', 'herr_t', 'htri_t', 'hid_t', 'hssize_t', 'ssize_t') \
-                or re.match(r'H5[A-Z]+_[a-zA-Z_]+_t', self.code):
-            self.err_condition = "<0"
-            self.err_value = f"<{self.code}>-1"
-        elif self.code in ('unsigned int', 'haddr_t', 'hsize_t', 'size_t'):
-            self.err_condition = "==0"
-            self.err_value = f"<{self.code}>0"
-        else:
-            raise ValueError("Return code <<%s>> unknown" % self.code)
+        self.err_condition, self.err_value = error_check(self.code)
 
 
 raw_preamble = """\
@@ -164,136 +176,170 @@ from ._errors cimport set_exception, set_default_error_handler
 """
 
 
-class LineProcessor(object):
+# Per-function templates, filled in from a Line instance
+raw_sig_template = "{0.code} {0.fname}({0.sig}) {0.nogil}\n"
 
-    def run(self):
+cython_sig_template = "cdef {0.code} {0.fname}({0.sig}) except {0.err_value}\n"
 
-        # Function definitions file
-        self.functions = open(op.join('h5py', 'api_functions.txt'), 'r')
+# Special case: https://github.com/h5py/h5py/issues/1475
+cython_sig_template_storage_size = \
+    "cdef {0.code} {0.fname}({0.sig}) except? {0.err_value}\n"
 
-        # Create output files
-        self.raw_defs = open(op.join('h5py', '_hdf5.pxd'), 'w')
-        self.cython_defs = open(op.join('h5py', 'defs.pxd'), 'w')
-        self.cython_imp = open(op.join('h5py', 'defs.pyx'), 'w')
+imp_template = """\
+cdef {0.code} {0.fname}({0.sig}) except {0.err_value}:
+    cdef {0.code} r
+    set_default_error_handler()
+    r = _hdf5.{0.fname}({0.args})
+    if r{0.err_condition}:
+        if set_exception():
+            return {0.err_value}
+        else:
+            raise RuntimeError("Unspecified error in {0.fname} (return value {0.err_condition})")
+    return r
+
+"""
 
-        self.raw_defs.write(raw_preamble)
-        self.cython_defs.write(def_preamble)
-        self.cython_imp.write(imp_preamble)
+imp_template_nogil = """\
+cdef {0.code} {0.fname}({0.sig}) except {0.err_value}:
+    cdef {0.code} r
+    with nogil:
+        set_default_error_handler()
+        r = _hdf5.{0.fname}({0.args})
+    if r{0.err_condition}:
+        if set_exception():
+            return {0.err_value}
+        else:
+            raise RuntimeError("Unspecified error in {0.fname} (return value {0.err_condition})")
+    return r
 
-        for text in self.functions:
+"""
 
-            # Directive specifying a header file
-            if not text.startswith(' ') and not text.startswith('#') and \
-            len(text.strip()) > 0:
-                inc = text.split(':')[0]
-                self.raw_defs.write('cdef extern from "%s.h":\n' % inc)
-                continue
+imp_template_storage_size = """\
+cdef {0.code} {0.fname}({0.sig}) except? {0.err_value}:
+    cdef {0.code} r
+    set_default_error_handler()
+    r = _hdf5.{0.fname}({0.args})
+    if r{0.err_condition}:
+        if set_exception():
+            return {0.err_value}
+    return r
 
-            text = text.strip()
+"""
 
-            # Whitespace or comment line
-            if len(text) == 0 or text[0] == '#':
-                continue
 
-            # Valid function line
-            self.line = Line(text)
-            self.write_raw_sig()
-            self.write_cython_sig()
-            self.write_cython_imp()
+class LineProcessor(object):
 
-        self.functions.close()
-        self.cython_imp.close()
-        self.cython_defs.close()
-        self.raw_defs.close()
+    __slots__ = ('line', 'conditions', 'raw_defs', 'cython_defs', 'cython_imp')
 
-    def add_cython_if(self, block):
-        """ Wrap a block of code in the required "IF" checks """
+    def run(self):
 
-        def wrapif(condition, code):
-            code = code.replace('\n', '\n    ', code.count('\n') - 1)  # Yes, -1.
-            code = "IF {0}:\n    {1}".format(condition, code)
-            return code
+        # Output is accumulated in memory and written out in one go at the
+        # end, rather than as several small writes per function line.
+        self.raw_defs = [raw_preamble]
+        self.cython_defs = [def_preamble]
+        self.cython_imp = [imp_preamble]
 
-        if self.line.mpi:
-            block = wrapif('MPI', block)
+        # Function definitions file
+        with open(op.join('h5py', 'api_functions.txt'), 'r') as functions:
+            for text in functions:
+
+                # Directive specifying a header file
+                if text[0] not in ' #' and len(text.strip()) > 0:
+                    inc = text.split(':')[0]
+                    self.raw_defs.append('cdef extern from "%s.h":\n' % inc)
+                    continue
+
+                text = text.strip()
+
+                # Whitespace or comment line
+                if len(text) == 0 or text[0] == '#':
+                    continue
+
+                # Valid function line
+                self.line = Line(text)
+                self.conditions = self.cython_conditions()
+                self.write_raw_sig()
+                self.write_cython_sig()
+                self.write_cython_imp()
+
+        # Create output files.  Files whose contents haven't changed are left
+        # alone, so their mtime doesn't make cythonize() rebuild every module
+        # which cimports them.
+        for fname, chunks in (('_hdf5.pxd', self.raw_defs),
+                              ('defs.pxd', self.cython_defs),
+                              ('defs.pyx', self.cython_imp)):
+            path = op.join('h5py', fname)
+            text = ''.join(chunks)
+            try:
+                with open(path, 'r') as f:
+                    if f.read() == text:
+                        continue
+            except FileNotFoundError:
+                pass
+            with open(path, 'w') as f:
+                f.write(text)
+
+    def cython_conditions(self):
+        """ List the "IF" conditions required by the current line, innermost
+        first """
+        line = self.line
+        conditions = []
+
+        if line.mpi:
+            conditions.append('MPI')
+
+        if line.ros3:
+            conditions.append('ROS3')
+
+        if line.min_version is not None and line.max_version is not None:
+            conditions.append('HDF5_VERSION >= {0.min_version} and HDF5_VERSION <= {0.max_version}'.format(line))
+        elif line.min_version is not None:
+            conditions.append('HDF5_VERSION >= {0.min_version}'.format(line))
+        elif line.max_version is not None:
+            conditions.append('HDF5_VERSION <= {0.max_version}'.format(line))
+
+        return conditions
 
-        if self.line.ros3:
-            block = wrapif('ROS3', block)
+    def add_cython_if(self, block):
+        """ Wrap a block of code in the required "IF" checks """
 
-        if self.line.min_version is not None and self.line.max_version is not None:
-            block = wrapif('HDF5_VERSION >= {0.min_version} and HDF5_VERSION <= {0.max_version}'.format(self.line), block)
-        elif self.line.min_version is not None:
-            block = wrapif('HDF5_VERSION >= {0.min_version}'.format(self.line), block)
-        elif self.line.max_version is not None:
-            block = wrapif('HDF5_VERSION <= {0.max_version}'.format(self.line), block)
+        for condition in self.conditions:
+            # Indent every line but the empty one after the final newline
+            lines = block.split('\n')
+            block = ''.join(("IF ", condition, ":\n    ",
+                             '\n    '.join(lines[:-1]), '\n', lines[-1]))
 
         return block
 
     def write_raw_sig(self):
         """ Write out "cdef extern"-style definition for an HDF5 function """
-        raw_sig = "{0.code} {0.fname}({0.sig}) {0.nogil}\n".format(self.line)
+        raw_sig = raw_sig_template.format(self.line)
         raw_sig = self.add_cython_if(raw_sig)
-        raw_sig = "\n".join(("    " + x if x.strip() else x) for x in raw_sig.split("\n"))
-        self.raw_defs.write(raw_sig)
+        # Indent into the "cdef extern" block; only the final line is empty
+        self.raw_defs.append("    " + raw_sig[:-1].replace("\n", "\n    ") + "\n")
 
     def write_cython_sig(self):
         """ Write out Cython signature for wrapper function """
         if self.line.fname == 'H5Dget_storage_size':
             # Special case: https://github.com/h5py/h5py/issues/1475
-            cython_sig = "cdef {0.code} {0.fname}({0.sig}) except? {0.err_value}\n".format(self.line)
+            cython_sig = cython_sig_template_storage_size.format(self.line)
         else:
-            cython_sig = "cdef {0.code} {0.fname}({0.sig}) except {0.err_value}\n".format(self.line)
+            cython_sig = cython_sig_template.format(self.line)
         cython_sig = self.add_cython_if(cython_sig)
-        self.cython_defs.write(cython_sig)
+        self.cython_defs.append(cython_sig)
 
     def write_cython_imp(self):
         """ Write out Cython wrapper implementation """
         if self.line.nogil:
-            imp = """\
-cdef {0.code} {0.fname}({0.sig}) except {0.err_value}:
-    cdef {0.code} r
-    with nogil:
-        set_default_error_handler()
-        r = _hdf5.{0.fname}({0.args})
-    if r{0.err_condition}:
-        if set_exception():
-            return {0.err_value}
-        else:
-            raise RuntimeError("Unspecified error in {0.fname} (return value {0.err_condition})")
-    return r
-
-"""
-        else:
-            if self.line.fname == 'H5Dget_storage_size':
-                # Special case: https://github.com/h5py/h5py/issues/1475
-                imp = """\
-cdef {0.code} {0.fname}({0.sig}) except? {0.err_value}:
-    cdef {0.code} r
-    set_default_error_handler()
-    r = _hdf5.{0.fname}({0.args})
-    if r{0.err_condition}:
-        if set_exception():
-            return {0.err_value}
-    return r
-
-"""
-            else:
-                imp = """\
-cdef {0.code} {0.fname}({0.sig}) except {0.err_value}:
-    cdef {0.code} r
-    set_default_error_handler()
-    r = _hdf5.{0.fname}({0.args})
-    if r{0.err_condition}:
-        if set_exception():
-            return {0.err_value}
+            imp = imp_template_nogil
+        elif self.line.fname == 'H5Dget_storage_size':
+            # Special case: https://github.com/h5py/h5py/issues/1475
+            imp = imp_template_storage_size
         else:
-            raise RuntimeError("Unspecified error in {0.fname} (return value {0.err_condition})")
-    return r
-
-"""
+            imp = imp_template
         imp = imp.format(self.line)
         imp = self.add_cython_if(imp)
-        self.cython_imp.write(imp)
+        self.cython_imp.append(imp)
 
 
 def run():
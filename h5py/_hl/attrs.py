@@ -14,6 +14,7 @@
     as <obj>.attrs.
 """
 
+from functools import lru_cache
 import numpy
 import uuid
 
@@ -23,6 +24,17 @@ from .base import phil, with_phil, Empty, is_empty_dataspace, product
 from .datatype import Datatype
 
 
+@lru_cache(maxsize=32)
+def _numeric_htypes(dtype):
+    """ Return the (file, memory) HDF5 types for a plain numeric dtype.
+
+    numpy dtype equality ignores h5py's metadata (e.g. enums), so callers
+    must only pass dtypes without metadata.  Bool and complex types are
+    named by the mutable h5py config, so they must not be cached either.
+    """
+    return h5t.py_create(dtype, logical=True), h5t.py_create(dtype)
+
+
 class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
 
     """
@@ -54,12 +66,13 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
         """ Read the value of an attribute.
         """
         attr = h5a.open(self._id, self._e(name))
+        space = attr.get_space()
 
-        if is_empty_dataspace(attr):
+        if space.get_simple_extent_type() == h5s.NULL:
             return Empty(attr.dtype)
 
         dtype = attr.dtype
-        shape = attr.shape
+        shape = space.get_simple_extent_dims()
 
         # Do this first, as we'll be fiddling with the dtype for top-level
         # array types
@@ -125,7 +138,11 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
         with phil:
             # First, make sure we have a NumPy array.  We leave the data type
             # conversion for HDF5 to perform.
-            if not isinstance(data, Empty):
+            if (dtype is None and shape is None
+                    and isinstance(data, (int, float, complex, numpy.number, numpy.bool_))):
+                # A single number, the most common attribute
+                data = numpy.asarray(data)
+            elif not isinstance(data, Empty):
                 data = base.array_for_new_object(data, specified_dtype=dtype)
 
             if shape is None:
@@ -165,7 +182,7 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
             # is compatible, and reshape if needed.
             else:
 
-                if shape is not None and numpy.product(shape, dtype=numpy.ulonglong) != numpy.product(data.shape, dtype=numpy.ulonglong):
+                if shape is not None and product(shape) != product(data.shape):
                     raise ValueError("Shape of new attribute conflicts with shape of data")
 
                 if shape != data.shape:
@@ -177,8 +194,11 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
 
             # Make HDF5 datatype and dataspace for the H5A calls
             if use_htype is None:
-                htype = h5t.py_create(original_dtype, logical=True)
-                htype2 = h5t.py_create(original_dtype)  # Must be bit-for-bit representation rather than logical
+                if original_dtype.kind in 'iuf' and original_dtype.metadata is None:
+                    htype, htype2 = _numeric_htypes(original_dtype)
+                else:
+                    htype = h5t.py_create(original_dtype, logical=True)
+                    htype2 = h5t.py_create(original_dtype)  # Must be bit-for-bit representation rather than logical
             else:
                 htype = use_htype
                 htype2 = None
@@ -189,28 +209,31 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
                 space = h5s.create_simple(shape)
 
             # This mess exists because you can't overwrite attributes in HDF5.
-            # So we write to a temporary attribute first, and then rename.
+            # So to replace one, we write to a temporary attribute first, and
+            # then rename.  A new attribute is written under its own name.
 
-            tempname = uuid.uuid4().hex
+            name = self._e(name)
+            exists = h5a.exists(self._id, name)
+            target = self._e(uuid.uuid4().hex) if exists else name
 
-            attr = h5a.create(self._id, self._e(tempname), htype, space)
+            attr = h5a.create(self._id, target, htype, space)
             try:
                 if not isinstance(data, Empty):
                     attr.write(data, mtype=htype2)
             except:
                 attr.close()
-                h5a.delete(self._id, self._e(tempname))
+                h5a.delete(self._id, target)
                 raise
             else:
-                try:
-                    # No atomic rename in HDF5 :(
-                    if h5a.exists(self._id, self._e(name)):
-                        h5a.delete(self._id, self._e(name))
-                    h5a.rename(self._id, self._e(tempname), self._e(name))
-                except:
-                    attr.close()
-                    h5a.delete(self._id, self._e(tempname))
-                    raise
+                if exists:
+                    try:
+                        # No atomic rename in HDF5 :(
+                        h5a.delete(self._id, name)
+                        h5a.rename(self._id, target, name)
+                    except:
+                        attr.close()
+                        h5a.delete(self._id, target)
+                        raise
             finally:
                 attr.close()
 
@@ -254,9 +277,6 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
         with phil:
 
             attrlist = []
-            def iter_cb(name, *args):
-                """ Callback to gather attribute names """
-                attrlist.append(self._d(name))
 
             cpl = self._id.get_create_plist()
             crt_order = cpl.get_attr_creation_order()
@@ -266,10 +286,12 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
             else:
                 idx_type = h5.INDEX_NAME
 
-            h5a.iterate(self._id, iter_cb, index_type=idx_type)
+            # Gather the raw names with list.append, which HDF5's callback
+            # can call without a Python frame, and decode them afterwards.
+            h5a.iterate(self._id, attrlist.append, index_type=idx_type)
 
         for name in attrlist:
-            yield name
+            yield self._d(name)
 
     @with_phil
     def __contains__(self, name):
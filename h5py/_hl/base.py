@@ -14,8 +14,11 @@
 from collections.abc import (
     Mapping, MutableMapping, KeysView, ValuesView, ItemsView
 )
+try:
+    from functools import cached_property
+except ImportError:
+    from cached_property import cached_property
 import os
-import posixpath
 
 import numpy as np
 
@@ -120,7 +123,7 @@ def array_for_new_object(data, specified_dtype=None):
     # In most cases, this does nothing. But if data was already an array,
     # and as_dtype is a tagged h5py dtype (e.g. for an object array of strings),
     # asarray() doesn't replace its dtype object. This gives it the tagged dtype:
-    if as_dtype is not None:
+    if as_dtype is not None and data.dtype is not as_dtype:
         data = data.view(dtype=as_dtype)
 
     return data
@@ -145,6 +148,20 @@ dlapl = default_lapl()
 dlcpl = default_lcpl()
 
 
+def _encoded_lcpl(coding):
+    """ Copy of the default LCPL with the given character encoding set """
+    lcpl = dlcpl.copy()
+    lcpl.set_char_encoding(coding)
+    return lcpl
+
+# The default LCPL for each name encoding, so that CommonStateObject._e
+# doesn't have to copy and modify a property list for every name.
+dlcpl_by_coding = {
+    h5t.CSET_ASCII: _encoded_lcpl(h5t.CSET_ASCII),
+    h5t.CSET_UTF8: _encoded_lcpl(h5t.CSET_UTF8),
+}
+
+
 def is_empty_dataspace(obj):
     """ Check if an object's dataspace is empty """
     if obj.get_space().get_simple_extent_type() == h5s.NULL:
@@ -186,6 +203,8 @@ class CommonStateObject(object):
         """
         def get_lcpl(coding):
             """ Create an appropriate link creation property list """
+            if self._lcpl is dlcpl:
+                return dlcpl_by_coding[coding]
             lcpl = self._lcpl.copy()
             lcpl.set_char_encoding(coding)
             return lcpl
@@ -195,13 +214,12 @@ class CommonStateObject(object):
 
         if isinstance(name, bytes):
             coding = h5t.CSET_ASCII
+        elif name.isascii():
+            name = name.encode('ascii')
+            coding = h5t.CSET_ASCII
         else:
-            try:
-                name = name.encode('ascii')
-                coding = h5t.CSET_ASCII
-            except UnicodeEncodeError:
-                name = name.encode('utf8')
-                coding = h5t.CSET_UTF8
+            name = name.encode('utf8')
+            coding = h5t.CSET_UTF8
 
         if lcpl:
             return name, get_lcpl(coding)
@@ -280,7 +298,6 @@ class HLObject(CommonStateObject):
     @property
     def file(self):
         """ Return a File instance associated with this object """
-        from . import files
         with phil:
             return files.File(self.id)
 
@@ -298,9 +315,11 @@ class HLObject(CommonStateObject):
         This is always equivalent to obj.file[posixpath.dirname(obj.name)].
         ValueError if this object is anonymous.
         """
-        if self.name is None:
+        name = self.name
+        if name is None:
             raise ValueError("Parent of an anonymous object is undefined")
-        return self.file[posixpath.dirname(self.name)]
+        # HDF5 names are absolute and normalised, so this matches dirname()
+        return self.file[name.rsplit('/', 1)[0] or '/']
 
     @property
     @with_phil
@@ -328,10 +347,10 @@ class HLObject(CommonStateObject):
         """
         return _RegionProxy(self)
 
-    @property
+    @cached_property
     def attrs(self):
         """ Attributes attached to this object """
-        from . import attrs
+        # The manager only holds our identifier, so one per object suffices
         with phil:
             return attrs.AttributeManager(self)
 
@@ -502,3 +521,9 @@ def product(nums):
     for n in nums:
         prod *= n
     return prod
+
+
+# These modules depend on HLObject, so they can only be imported once the
+# definitions above exist.  Binding them here rather than inside the
+# HLObject.file/.attrs properties saves an import statement on every access.
+from . import attrs, files
@@ -15,15 +15,15 @@ try:
     from functools import cached_property
 except ImportError:
     from cached_property import cached_property
-import posixpath as pp
 import sys
+from operator import index
 
 from threading import local
 
 import numpy
 
-from .. import h5, h5s, h5t, h5r, h5d, h5p, h5fd, h5ds, _selector
-from .base import HLObject, phil, with_phil, Empty, find_item_type
+from .. import h5, h5s, h5t, h5r, h5d, h5f, h5i, h5p, h5fd, h5ds, _selector
+from .base import HLObject, phil, with_phil, Empty, find_item_type, product
 from . import filters
 from . import selections as sel
 from . import selections2 as sel2
@@ -32,16 +32,74 @@ from .compat import filename_decode
 from .vds import VDSmap, vds_support
 
 _LEGACY_GZIP_COMPRESSION_VALS = frozenset(range(10))
+_ITER_BLOCK_NBYTES = 1024 * 1024  # Target read size for Dataset.__iter__
+_TCONV_BUF_NBYTES = 1024 * 1024  # HDF5's default type conversion buffer size
+_BROADCAST_BUF_NBYTES = 1024 * 1024  # Memory to expand broadcast writes into
 MPI = h5.get_config().mpi
 
 
+def _split_field_names(args):
+    """ Separate field names (str) from the other indexing arguments.
+
+    Returns a 2-tuple (names, args) of tuples, each keeping the original order.
+    """
+    names = []
+    rest = []
+    for x in args:
+        if isinstance(x, str):
+            names.append(x)
+        else:
+            rest.append(x)
+    return tuple(names), tuple(rest)
+
+
+def _whole_chunk_offset(args, chunks, shape):
+    """ Return the offset of the single chunk exactly covered by a tuple of
+    slices, or None if the selection is anything else.
+    """
+    if len(args) != len(chunks):
+        return None
+    offset = []
+    for s, chunk, length in zip(args, chunks, shape):
+        if not isinstance(s, slice) or s.step not in (None, 1):
+            return None
+        try:
+            start = 0 if s.start is None else index(s.start)
+            stop = length if s.stop is None else index(s.stop)
+        except TypeError:
+            return None
+        if start < 0 or start % chunk or stop != start + chunk or stop > length:
+            return None
+        offset.append(start)
+    return tuple(offset)
+
+
+def _normalize_compression(compression, compression_opts):
+    """ Map the legacy compression=True and compression=<0-9> spellings
+    onto gzip; returns a (compression, compression_opts) pair.
+    """
+    if compression is True:
+        return 'gzip', (4 if compression_opts is None else compression_opts)
+    if compression in _LEGACY_GZIP_COMPRESSION_VALS:
+        if compression_opts is not None:
+            raise TypeError("Conflict in compression options")
+        return 'gzip', compression
+    return compression, compression_opts
+
+
 def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
                   chunks=None, compression=None, shuffle=None,
                   fletcher32=None, maxshape=None, compression_opts=None,
                   fillvalue=None, scaleoffset=None, track_times=None,
                   external=None, track_order=None, dcpl=None,
-                  allow_unknown_filter=False):
-    """ Return a new low-level dataset identifier """
+                  allow_unknown_filter=False, rdcc_nslots=None,
+                  rdcc_nbytes=None, rdcc_w0=None):
+    """ Return a new low-level dataset identifier and the creation property
+    list it was made with.
+
+    The property list is dcpl filled in, except for scalar and empty
+    datasets, which get a new one.
+    """
 
     # Convert data to a C-contiguous ndarray
     if data is not None and not isinstance(data, Empty):
@@ -57,7 +115,7 @@ def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
         shape = data.shape
     else:
         shape = (shape,) if isinstance(shape, int) else tuple(shape)
-        if data is not None and (numpy.product(shape, dtype=numpy.ulonglong) != numpy.product(data.shape, dtype=numpy.ulonglong)):
+        if data is not None and product(shape) != product(data.shape):
             raise ValueError("Shape tuple is incompatible with data")
 
     if isinstance(maxshape, int):
@@ -92,18 +150,7 @@ def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
     if any((compression, shuffle, fletcher32, maxshape, scaleoffset)) and chunks is False:
         raise ValueError("Chunked format required for given storage options")
 
-    # Legacy
-    if compression is True:
-        if compression_opts is None:
-            compression_opts = 4
-        compression = 'gzip'
-
-    # Legacy
-    if compression in _LEGACY_GZIP_COMPRESSION_VALS:
-        if compression_opts is not None:
-            raise TypeError("Conflict in compression options")
-        compression_opts = compression
-        compression = 'gzip'
+    compression, compression_opts = _normalize_compression(compression, compression_opts)
     dcpl = filters.fill_dcpl(
         dcpl or h5p.create(h5p.DATASET_CREATE), shape, dtype,
         chunks, compression, compression_opts, shuffle, fletcher32,
@@ -134,12 +181,33 @@ def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
         sid = h5s.create_simple(shape, maxshape)
 
 
-    dset_id = h5d.create(parent.id, name, tid, sid, dcpl=dcpl)
+    dapl = _make_dapl(parent, dcpl, rdcc_nslots, rdcc_nbytes, rdcc_w0)
+
+    dset_id = h5d.create(parent.id, name, tid, sid, dcpl=dcpl, dapl=dapl)
 
     if (data is not None) and (not isinstance(data, Empty)):
         dset_id.write(h5s.ALL, h5s.ALL, data)
 
-    return dset_id
+    return dset_id, dcpl
+
+
+def _make_dapl(parent, dcpl, rdcc_nslots, rdcc_nbytes, rdcc_w0):
+    """ Return an access property list giving a new chunked dataset its own
+    raw data chunk cache, or None to share the file's settings.
+
+    Settings not given are taken from the file.
+    """
+    if rdcc_nslots is None and rdcc_nbytes is None and rdcc_w0 is None:
+        return None
+    if dcpl.get_layout() != h5d.CHUNKED:
+        return None
+
+    _, nslots, nbytes, w0 = h5i.get_file_id(parent.id).get_access_plist().get_cache()
+    dapl = h5p.create(h5p.DATASET_ACCESS)
+    dapl.set_chunk_cache(nslots if rdcc_nslots is None else rdcc_nslots,
+                         nbytes if rdcc_nbytes is None else rdcc_nbytes,
+                         w0 if rdcc_w0 is None else rdcc_w0)
+    return dapl
 
 
 def make_new_virtual_dset(parent, shape, sources, dtype, name=None,
@@ -223,11 +291,29 @@ class FieldsWrapper:
         self.dset = dset
         if isinstance(names, str):
             self.extract_field = names
-            names = [names]
-        self.read_dtype = readtime_dtype(prior_dtype, names)
+            names = (names,)
+        else:
+            names = tuple(names)
+        if prior_dtype is None:
+            # Reading fields of the stored type: reuse the dtype and memory
+            # type made for the same names before.  Only integer and float
+            # fields are cached, as bools and complex numbers are named by the
+            # mutable h5py config.
+            try:
+                self.read_dtype, self.read_mtype = dset._field_types[names]
+            except KeyError:
+                self.read_dtype = readtime_dtype(dset.dtype, names)
+                self.read_mtype = h5t.py_create(self.read_dtype)
+                if all(dset.dtype.fields[name][0].kind in 'iuf'
+                       for name in names):
+                    dset._field_types[names] = self.read_dtype, self.read_mtype
+        else:
+            self.read_dtype = readtime_dtype(prior_dtype, names)
+            self.read_mtype = None
 
     def __getitem__(self, args):
-        data = self.dset.__getitem__(args, new_dtype=self.read_dtype)
+        data = self.dset.__getitem__(args, new_dtype=self.read_dtype,
+                                     _mtype=self.read_mtype)
         if self.extract_field is not None:
             data = data[self.extract_field]
         return data
@@ -258,10 +344,12 @@ if MPI:
         def __enter__(self):
             # pylint: disable=protected-access
             self._dset._dxpl.set_dxpl_mpio(h5fd.MPIO_COLLECTIVE)
+            self._dset._sized_dxpls.clear()
 
         def __exit__(self, *args):
             # pylint: disable=protected-access
             self._dset._dxpl.set_dxpl_mpio(h5fd.MPIO_INDEPENDENT)
+            self._dset._sized_dxpls.clear()
 
 
 class ChunkIterator(object):
@@ -379,8 +467,6 @@ class Dataset(HLObject):
         arrays will have that dtype. Otherwise, it should be an iterable,
         and the read data will have a compound dtype.
         """
-        if _prior_dtype is None:
-            _prior_dtype = self.dtype
         return FieldsWrapper(self, _prior_dtype, names)
 
     if MPI:
@@ -397,7 +483,7 @@ class Dataset(HLObject):
         with phil:
             return DimensionManager(self)
 
-    @property
+    @cached_property
     @with_phil
     def ndim(self):
         """Numpy-style attribute giving the number of dimensions"""
@@ -477,13 +563,16 @@ class Dataset(HLObject):
             self._cache_props['_fast_reader'] = rdr
         return rdr
 
-    @property
+    # The datatype, layout and filter pipeline of a dataset are fixed when it
+    # is created, so these can be cached for the lifetime of the object.
+
+    @cached_property
     @with_phil
     def dtype(self):
         """Numpy dtype representing the datatype"""
         return self.id.dtype
 
-    @property
+    @cached_property
     @with_phil
     def chunks(self):
         """Dataset chunks (or None)"""
@@ -492,7 +581,7 @@ class Dataset(HLObject):
             return dcpl.get_chunk()
         return None
 
-    @property
+    @cached_property
     @with_phil
     def compression(self):
         """Compression strategy (or None)"""
@@ -546,7 +635,7 @@ class Dataset(HLObject):
             ext_list.append( (filename_decode(name), offset, size) )
         return ext_list
 
-    @property
+    @cached_property
     @with_phil
     def maxshape(self):
         """Shape up to which this dataset can be resized.  Axes with value
@@ -572,26 +661,100 @@ class Dataset(HLObject):
         """Get extent type for this dataset - SIMPLE, SCALAR or NULL"""
         return self.id.get_space().get_simple_extent_type()
 
+    @cached_property
+    def _default_mtype(self):
+        """HDF5 memory type for reading without a dtype conversion, or None
+        if it must be made for each read"""
+        # Other types may include bools or complex numbers, which are named
+        # by the mutable h5py config.
+        if self.dtype.kind not in 'iuf':
+            return None
+        return h5t.py_create(self.dtype)
+
+    def _numeric_mtype(self, dtype):
+        """HDF5 memory type for a plain numeric dtype, cached; None otherwise"""
+        # numpy dtype equality ignores h5py's metadata (enums, vlens), and
+        # bool and complex types are named by the mutable h5py config, so
+        # only plain integer and float types are safe to key the cache on.
+        if dtype.kind not in 'iuf' or dtype.metadata is not None:
+            return None
+        try:
+            return self._astype_mtypes[dtype]
+        except KeyError:
+            mtype = self._astype_mtypes[dtype] = h5t.py_create(dtype)
+            return mtype
+
     @cached_property
     def _is_empty(self):
         """Check if extent type is empty"""
         return self._extent_type == h5s.NULL
 
+    @cached_property
+    def _dcpl(self):
+        """Creation property list, fetched on first use"""
+        return self.id.get_create_plist()
+
+    @cached_property
+    def _filters(self):
+        """Filter pipeline of the creation property list"""
+        return filters.get_filters(self._dcpl)
+
+    @cached_property
+    def _broadcast_limit(self):
+        """Most elements to expand a broadcast write into: a chunk or
+        _BROADCAST_BUF_NBYTES, whichever is larger"""
+        return max(product(self.chunks) if self.chunks else 1,
+                   _BROADCAST_BUF_NBYTES // self.dtype.itemsize)
+
+    @cached_property
+    def _dxpl(self):
+        """Transfer property list, made on first read or write"""
+        return h5p.create(h5p.DATASET_XFER)
+
+    def _conv_dxpl(self, nbytes):
+        """ Transfer property list for a read or write of nbytes which needs
+        a type conversion.
+
+        HDF5 allocates its conversion buffer (and a zeroed background buffer
+        for compound types) on every such call, at 1 MiB by default; for
+        small transfers that costs far more than the I/O.  Smaller buffers
+        are sized in powers of two so only a few plists are ever made.
+        """
+        if nbytes >= _TCONV_BUF_NBYTES:
+            return self._dxpl
+        size = max(4096, 1 << (nbytes - 1).bit_length())
+        try:
+            return self._sized_dxpls[size]
+        except KeyError:
+            dxpl = self._dxpl.copy()
+            dxpl.set_buffer(size)
+            self._sized_dxpls[size] = dxpl
+            return dxpl
+
     @with_phil
-    def __init__(self, bind, *, readonly=False):
+    def __init__(self, bind, *, readonly=False, _dcpl=None):
         """ Create a new Dataset object by binding to a low-level DatasetID.
+
+        _dcpl is for internal use: the creation property list of a dataset
+        that was just made.  Its filter pipeline is checked immediately;
+        otherwise the plist and filters are only read when first needed.
         """
         if not isinstance(bind, h5d.DatasetID):
             raise ValueError("%s is not a DatasetID" % bind)
         super(Dataset, self).__init__(bind)
 
-        self._dcpl = self.id.get_create_plist()
-        self._dxpl = h5p.create(h5p.DATASET_XFER)
-        self._filters = filters.get_filters(self._dcpl)
+        if _dcpl is not None:
+            self._dcpl = _dcpl
+            self._filters = filters.get_filters(_dcpl)
         self._readonly = readonly
         self._cache_props = {}
         self._local = local()
         self._local.astype = None
+        self._scalar_buf = None
+        self._empty_arrays = {}
+        self._astype_mtypes = {}
+        self._sized_dxpls = {}
+        self._field_types = {}
 
     def resize(self, size, axis=None):
         """ Resize the dataset, or the specified axis.
@@ -657,8 +820,16 @@ class Dataset(HLObject):
         shape = self.shape
         if len(shape) == 0:
             raise TypeError("Can't iterate over a scalar dataset")
-        for i in range(shape[0]):
-            yield self[i]
+
+        # Read blocks of rows rather than making one HDF5 read per row,
+        # keeping blocks aligned to chunk boundaries where possible.
+        row_nbytes = max(self.dtype.itemsize * product(shape[1:]), 1)
+        step = max(_ITER_BLOCK_NBYTES // row_nbytes, 1)
+        chunks = self.chunks
+        if chunks is not None and step > chunks[0]:
+            step -= step % chunks[0]
+        for start in range(0, shape[0], step):
+            yield from self[start:start + step]
 
     @with_phil
     def iter_chunks(self, sel=None):
@@ -685,8 +856,22 @@ class Dataset(HLObject):
             and isinstance(self.id.get_type(), (h5t.TypeIntegerID, h5t.TypeFloatID))
         )
 
+    @cached_property
+    def _direct_chunk_write_ok(self):
+        """Can whole chunks be written to the file as they are in memory"""
+        return (
+            not MPI
+            and hasattr(self.id, 'write_direct_chunk')
+            # HDF5 doesn't check for write intent on this path
+            and self.file.id.get_intent() == h5f.ACC_RDWR
+            and self.chunks is not None
+            and self._dcpl.get_nfilters() == 0
+            and self.dtype.kind in 'biufc'
+            and self.id.get_type() == h5t.py_create(self.dtype)
+        )
+
     @with_phil
-    def __getitem__(self, args, new_dtype=None):
+    def __getitem__(self, args, new_dtype=None, _mtype=None):
         """ Read a slice from the HDF5 dataset.
 
         Takes slices and recarray-style field names (more than one is
@@ -716,18 +901,25 @@ class Dataset(HLObject):
             raise ValueError("Empty datasets cannot be sliced")
 
         # Sort field names from the rest of the args.
-        names = tuple(x for x in args if isinstance(x, str))
+        names, args = _split_field_names(args)
 
         if names:
             # Read a subset of the fields in this structured dtype
             if len(names) == 1:
                 names = names[0]  # Read with simpler dtype of this field
-            args = tuple(x for x in args if not isinstance(x, str))
             return self.fields(names, _prior_dtype=new_dtype)[args]
 
         if new_dtype is None:
             new_dtype = self.dtype
-        mtype = h5t.py_create(new_dtype)
+            mtype = self._default_mtype
+            if mtype is None:
+                mtype = h5t.py_create(new_dtype)
+        elif _mtype is not None:
+            mtype = _mtype
+        else:
+            mtype = self._numeric_mtype(new_dtype)
+            if mtype is None:
+                mtype = h5t.py_create(new_dtype)
 
         # === Special-case region references ====
 
@@ -780,14 +972,26 @@ class Dataset(HLObject):
         selection = sel.select(self.shape, args, dataset=self)
 
         if selection.nselect == 0:
-            return numpy.ndarray(selection.array_shape, dtype=new_dtype)
+            # Reshaping a cached zero-size array is cheaper than creating one.
+            # Each caller gets a new view; there is no data to share.
+            try:
+                empty = self._empty_arrays[new_dtype]
+            except KeyError:
+                empty = self._empty_arrays[new_dtype] = numpy.ndarray((0,), dtype=new_dtype)
+            return empty.reshape(selection.array_shape)
 
         arr = numpy.ndarray(selection.array_shape, new_dtype, order='C')
 
+        if new_dtype is self.dtype and self.dtype.kind in 'biufc':
+            dxpl = self._dxpl
+        else:
+            dxpl = self._conv_dxpl(
+                selection.nselect * max(arr.itemsize, self.dtype.itemsize))
+
         # Perform the actual read
         mspace = h5s.create_simple(selection.mshape)
         fspace = selection.id
-        self.id.read(mspace, fspace, arr, mtype, dxpl=self._dxpl)
+        self.id.read(mspace, fspace, arr, mtype, dxpl=dxpl)
 
         # Patch up the output for NumPy
         if arr.shape == ():
@@ -805,8 +1009,18 @@ class Dataset(HLObject):
         args = args if isinstance(args, tuple) else (args,)
 
         # Sort field indices from the slicing
-        names = tuple(x for x in args if isinstance(x, str))
-        args = tuple(x for x in args if not isinstance(x, str))
+        names, args = _split_field_names(args)
+
+        # A whole chunk whose bytes are already in the file's format (and
+        # which no filters would change) can skip selection and conversion.
+        if (not names and isinstance(val, numpy.ndarray)
+                and self._direct_chunk_write_ok
+                and val.shape == self.chunks and val.dtype == self.dtype
+                and val.flags.c_contiguous):
+            offset = _whole_chunk_offset(args, self.chunks, self.shape)
+            if offset is not None:
+                self.id.write_direct_chunk(offset, val)
+                return
 
         # Generally we try to avoid converting the arrays on the Python
         # side.  However, for compound literals this is unavoidable.
@@ -824,7 +1038,7 @@ class Dataset(HLObject):
                 if val.ndim > 1:
                     tmp = numpy.empty(shape=val.shape[:-1], dtype=object)
                     tmp.ravel()[:] = [i for i in val.reshape(
-                        (numpy.product(val.shape[:-1], dtype=numpy.ulonglong), val.shape[-1]))]
+                        (product(val.shape[:-1]), val.shape[-1]))]
                 else:
                     tmp = numpy.array([None], dtype=object)
                     tmp[0] = val
@@ -861,6 +1075,15 @@ class Dataset(HLObject):
             val = numpy.array([
                 s.encode('utf-8') for s in str_array.flat
             ], dtype=self.dtype).reshape(str_array.shape)
+        elif (self.dtype.kind in 'biufc'
+              and isinstance(val, (int, float, complex, numpy.generic))):
+            # Writing a single number: convert it in a reusable 0-d buffer
+            # rather than allocating a new array for every assignment.
+            # The buffer is only used while phil is held.
+            if self._scalar_buf is None:
+                self._scalar_buf = numpy.empty((), dtype=self.dtype)
+            self._scalar_buf[()] = val
+            val = self._scalar_buf
         else:
             # If the input data is already an array, let HDF5 do the conversion.
             # If it's a list or similar, don't make numpy guess a dtype for it.
@@ -919,12 +1142,12 @@ class Dataset(HLObject):
         # In order to avoid slow broadcasting filling the destination by
         # the scalar value, we create an intermediate array of the same
         # size as the destination buffer provided that size is reasonable.
-        # We assume as reasonable a size smaller or equal as the used dataset
-        # chunk size if any.
-        # In case of dealing with a non-chunked destination dataset or with
-        # a selection whose size is larger than the dataset chunk size we fall
-        # back to using an intermediate array of size equal to the last dimension
-        # of the destination buffer.
+        # We assume as reasonable a size smaller or equal to the larger of
+        # the dataset chunk size, if any, and _BROADCAST_BUF_NBYTES
+        # (self._broadcast_limit).
+        # For bigger selections the intermediate array covers as many of the
+        # trailing dimensions as fit in that size (at least the last one),
+        # and is repeated over the rest.
         # The reasoning behind is that it makes sense to assume the creator of
         # the dataset used an appropriate chunk size according the available
         # memory. In any case, if we cannot afford to create an intermediate
@@ -933,19 +1156,34 @@ class Dataset(HLObject):
         if mshape == () and selection.array_shape != ():
             if self.dtype.subdtype is not None:
                 raise TypeError("Scalar broadcasting is not supported for array dtypes")
-            if self.chunks and (numpy.prod(self.chunks, dtype=numpy.float64) >=
-                                numpy.prod(selection.array_shape, dtype=numpy.float64)):
-                val2 = numpy.empty(selection.array_shape, dtype=val.dtype)
-            else:
-                val2 = numpy.empty(selection.array_shape[-1], dtype=val.dtype)
-            val2[...] = val
-            val = val2
+            # HDF5 can't broadcast a single-element memory buffer itself;
+            # writing one through selection.broadcast((1,)) would mean one
+            # H5Dwrite call per element.
+            bshape = selection.array_shape
+            while len(bshape) > 1 and product(bshape) > self._broadcast_limit:
+                bshape = bshape[1:]
+            val = numpy.full(bshape, val, dtype=val.dtype)
+            mshape = val.shape
+
+        # Likewise, an array repeated across the selection is expanded in
+        # memory (within the same size limit), so it takes one write rather
+        # than one per repeat.
+        elif (self.dtype.subdtype is None and val.size < selection.nselect
+              and selection.nselect <= self._broadcast_limit):
+            eshape = selection.expand_shape(mshape)
+            val = numpy.broadcast_to(val.reshape(eshape), selection.mshape)
+            val = numpy.ascontiguousarray(val).reshape(selection.array_shape)
             mshape = val.shape
 
+        if mtype is None and val.dtype == self.dtype and self.dtype.kind in 'biufc':
+            dxpl = self._dxpl
+        else:
+            dxpl = self._conv_dxpl(val.size * max(val.itemsize, self.dtype.itemsize))
+
         # Perform the write, with broadcasting
         mspace = h5s.create_simple(selection.expand_shape(mshape))
         for fspace in selection.broadcast(mshape):
-            self.id.write(mspace, fspace, val, mtype, dxpl=self._dxpl)
+            self.id.write(mspace, fspace, val, mtype, dxpl=dxpl)
 
     def read_direct(self, dest, source_sel=None, dest_sel=None):
         """ Read data directly from HDF5 into an existing NumPy array.
@@ -963,6 +1201,18 @@ class Dataset(HLObject):
             else:
                 source_sel = sel.select(self.shape, source_sel, self)  # for numpy.s_
             fspace = source_sel.id
+            mtype = self._numeric_mtype(dest.dtype)
+            if dest.dtype == self.dtype and self.dtype.kind in 'biufc':
+                dxpl = self._dxpl
+            else:
+                dxpl = self._conv_dxpl(source_sel.nselect *
+                                       max(dest.itemsize, self.dtype.itemsize))
+
+            if dest_sel is None and dest.shape == source_sel.array_shape:
+                # Filling the whole array: nothing to broadcast
+                mspace = h5s.create_simple(dest.shape)
+                self.id.read(mspace, fspace, dest, mtype, dxpl=dxpl)
+                return
 
             if dest_sel is None:
                 dest_sel = sel.SimpleSelection(dest.shape)
@@ -970,7 +1220,7 @@ class Dataset(HLObject):
                 dest_sel = sel.select(dest.shape, dest_sel)
 
             for mspace in dest_sel.broadcast(source_sel.array_shape):
-                self.id.read(mspace, fspace, dest, dxpl=self._dxpl)
+                self.id.read(mspace, fspace, dest, mtype, dxpl=dxpl)
 
     def write_direct(self, source, source_sel=None, dest_sel=None):
         """ Write data directly to HDF5 from a NumPy array.
@@ -1006,7 +1256,7 @@ class Dataset(HLObject):
         arr = numpy.empty(self.shape, dtype=self.dtype if dtype is None else dtype)
 
         # Special case for (0,)*-shape datasets
-        if numpy.product(self.shape, dtype=numpy.ulonglong) == 0:
+        if product(self.shape) == 0:
             return arr
 
         self.read_direct(arr)
@@ -1017,10 +1267,11 @@ class Dataset(HLObject):
         if not self:
             r = '<Closed HDF5 dataset>'
         else:
-            if self.name is None:
+            name = self.name
+            if name is None:
                 namestr = '("anonymous")'
             else:
-                name = pp.basename(pp.normpath(self.name))
+                name = name.rsplit('/', 1)[-1]
                 namestr = '"%s"' % (name if name != '' else '/')
             r = '<HDF5 dataset %s: shape %s, type "%s">' % (
                 namestr, self.shape, self.dtype.str
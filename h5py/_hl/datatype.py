@@ -11,7 +11,6 @@
     Implements high-level access to committed datatypes in the file.
 """
 
-import posixpath as pp
 
 from ..h5t import TypeID
 from .base import HLObject, with_phil
@@ -46,10 +45,11 @@ class Datatype(HLObject):
     def __repr__(self):
         if not self.id:
             return "<Closed HDF5 named type>"
-        if self.name is None:
+        name = self.name
+        if name is None:
             namestr = '("anonymous")'
         else:
-            name = pp.basename(pp.normpath(self.name))
+            name = name.rsplit('/', 1)[-1]
             namestr = '"%s"' % (name if name != '' else '/')
         return '<HDF5 named type %s (dtype %s)>' % \
             (namestr, self.dtype.str)
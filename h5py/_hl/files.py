@@ -13,12 +13,19 @@
 
 import sys
 import os
+from functools import lru_cache
 from warnings import warn
 
+try:
+    from functools import cached_property
+except ImportError:
+    from cached_property import cached_property
+
 from .compat import filename_decode, filename_encode
 
 from .base import phil, with_phil
 from .group import Group
+from . import attrs
 from .. import h5, h5f, h5p, h5i, h5fd, _objects
 from .. import version
 
@@ -61,8 +68,9 @@ _drivers = {
     'sec2': lambda plist, **kwargs: plist.set_fapl_sec2(**kwargs),
     'stdio': lambda plist, **kwargs: plist.set_fapl_stdio(**kwargs),
     'core': lambda plist, **kwargs: plist.set_fapl_core(**kwargs),
+    # Members are opened with the default (sec2) driver
     'family': lambda plist, **kwargs: plist.set_fapl_family(
-        memb_fapl=plist.copy(),
+        memb_fapl=_default_fapl,
         **kwargs
     ),
     'mpio': _set_fapl_mpio,
@@ -73,6 +81,17 @@ _drivers = {
 if ros3:
     _drivers['ros3'] = lambda plist, **kwargs: plist.set_fapl_ros3(**kwargs)
 
+_driver_names = {h5fd.SEC2: 'sec2',
+                 h5fd.STDIO: 'stdio',
+                 h5fd.CORE: 'core',
+                 h5fd.FAMILY: 'family',
+                 h5fd.WINDOWS: 'windows',
+                 h5fd.MPIO: 'mpio',
+                 h5fd.MPIPOSIX: 'mpiposix',
+                 h5fd.fileobj_driver: 'fileobj'}
+if ros3:
+    _driver_names[h5fd.ROS3D] = 'ros3'
+
 
 def register_driver(name, set_fapl):
     """Register a custom driver.
@@ -85,6 +104,7 @@ def register_driver(name, set_fapl):
         The function to set the fapl to use your custom driver.
     """
     _drivers[name] = set_fapl
+    _shared_fapl.cache_clear()
 
 
 def unregister_driver(name):
@@ -96,6 +116,7 @@ def unregister_driver(name):
         The name of the driver.
     """
     del _drivers[name]
+    _shared_fapl.cache_clear()
 
 
 def registered_drivers():
@@ -104,8 +125,51 @@ def registered_drivers():
     return frozenset(_drivers)
 
 
+# Drivers whose settings are plain values, so one file access plist can
+# serve every open with the same arguments.  HDF5 copies the plist when
+# opening a file; fileobj and mpio keep references to Python objects.
+_SHAREABLE_DRIVERS = frozenset({None, 'sec2', 'stdio', 'core', 'family', 'split'})
+
+
 def make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, **kwds):
     """ Set up a file access property list """
+    if driver == 'windows' and sys.platform == 'win32':
+        # The default driver on Windows
+        driver = None
+
+    if driver is None:
+        # Prevent swallowing unused key arguments
+        if kwds:
+            msg = "'{key}' is an invalid keyword argument for this function" \
+                  .format(key=next(iter(kwds)))
+            raise TypeError(msg)
+
+        if (libver is None and rdcc_nslots is None and rdcc_nbytes is None
+                and rdcc_w0 is None):
+            # All defaults: the plist is only read when opening the file
+            return _default_fapl
+    elif driver not in _drivers:
+        raise ValueError('Unknown driver type "%s"' % driver)
+
+    if driver in _SHAREABLE_DRIVERS:
+        key = (driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0,
+               frozenset(kwds.items()))
+        try:
+            hash(key)
+        except TypeError:
+            pass    # e.g. libver given as a list
+        else:
+            return _shared_fapl(*key)
+
+    return _new_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, kwds)
+
+
+@lru_cache(maxsize=32)
+def _shared_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, kwds):
+    return _new_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, dict(kwds))
+
+
+def _new_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, kwds):
     plist = h5p.create(h5p.FILE_ACCESS)
 
     if libver is not None:
@@ -119,33 +183,26 @@ def make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, **kwds):
         low, high = h5f.LIBVER_EARLIEST, h5f.LIBVER_LATEST
     plist.set_libver_bounds(low, high)
 
-    cache_settings = list(plist.get_cache())
-    if rdcc_nslots is not None:
-        cache_settings[1] = rdcc_nslots
-    if rdcc_nbytes is not None:
-        cache_settings[2] = rdcc_nbytes
-    if rdcc_w0 is not None:
-        cache_settings[3] = rdcc_w0
-    plist.set_cache(*cache_settings)
+    if rdcc_nslots is not None or rdcc_nbytes is not None or rdcc_w0 is not None:
+        cache_settings = list(plist.get_cache())
+        if rdcc_nslots is not None:
+            cache_settings[1] = rdcc_nslots
+        if rdcc_nbytes is not None:
+            cache_settings[2] = rdcc_nbytes
+        if rdcc_w0 is not None:
+            cache_settings[3] = rdcc_w0
+        plist.set_cache(*cache_settings)
 
-    if driver is None or (driver == 'windows' and sys.platform == 'win32'):
-        # Prevent swallowing unused key arguments
-        if kwds:
-            msg = "'{key}' is an invalid keyword argument for this function" \
-                  .format(key=next(iter(kwds)))
-            raise TypeError(msg)
-        return plist
-
-    try:
-        set_fapl = _drivers[driver]
-    except KeyError:
-        raise ValueError('Unknown driver type "%s"' % driver)
-    else:
-        set_fapl(plist, **kwds)
+    if driver is not None:
+        _drivers[driver](plist, **kwds)
 
     return plist
 
 
+_default_fapl = h5p.create(h5p.FILE_ACCESS)
+_default_fapl.set_libver_bounds(h5f.LIBVER_EARLIEST, h5f.LIBVER_LATEST)
+
+
 def make_fcpl(track_order=False, fs_strategy=None, fs_persist=False, fs_threshold=1):
     """ Set up a file creation property list """
     if track_order or fs_strategy:
@@ -172,6 +229,10 @@ def make_fcpl(track_order=False, fs_strategy=None, fs_persist=False, fs_threshol
     return plist
 
 
+# Modes which always create a new file, and the flags to do so
+_create_flags = {'w': h5f.ACC_TRUNC, 'w-': h5f.ACC_EXCL, 'x': h5f.ACC_EXCL}
+
+
 def make_fid(name, mode, userblock_size, fapl, fcpl=None, swmr=False):
     """ Get a new FileID by opening or creating a file.
     Also validates mode argument."""
@@ -195,10 +256,8 @@ def make_fid(name, mode, userblock_size, fapl, fcpl=None, swmr=False):
         fid = h5f.open(name, flags, fapl=fapl)
     elif mode == 'r+':
         fid = h5f.open(name, h5f.ACC_RDWR, fapl=fapl)
-    elif mode in ['w-', 'x']:
-        fid = h5f.create(name, h5f.ACC_EXCL, fapl=fapl, fcpl=fcpl)
-    elif mode == 'w':
-        fid = h5f.create(name, h5f.ACC_TRUNC, fapl=fapl, fcpl=fcpl)
+    elif mode in _create_flags:
+        fid = h5f.create(name, _create_flags[mode], fapl=fapl, fcpl=fcpl)
     elif mode == 'a':
         # Open in append mode (read/write).
         # If that fails, create a new file only if it won't clobber an
@@ -228,36 +287,31 @@ class File(Group):
         Represents an HDF5 file.
     """
 
-    @property
+    @cached_property
     def attrs(self):
         """ Attributes attached to this object """
         # hdf5 complains that a file identifier is an invalid location for an
         # attribute. Instead of self, pass the root group to AttributeManager:
-        from . import attrs
         with phil:
             return attrs.AttributeManager(self['/'])
 
+    _filename = None
+
     @property
     @with_phil
     def filename(self):
         """File name on disk"""
-        return filename_decode(h5f.get_name(self.id))
+        # The name is kept after the first lookup, but a closed file should
+        # still raise like HDF5 does for its other properties.
+        if self._filename is None or not self.id.valid:
+            self._filename = filename_decode(h5f.get_name(self.id))
+        return self._filename
 
     @property
     @with_phil
     def driver(self):
         """Low-level HDF5 file driver used to open file"""
-        drivers = {h5fd.SEC2: 'sec2',
-                   h5fd.STDIO: 'stdio',
-                   h5fd.CORE: 'core',
-                   h5fd.FAMILY: 'family',
-                   h5fd.WINDOWS: 'windows',
-                   h5fd.MPIO: 'mpio',
-                   h5fd.MPIPOSIX: 'mpiposix',
-                   h5fd.fileobj_driver: 'fileobj'}
-        if ros3:
-            drivers[h5fd.ROS3D] = 'ros3'
-        return drivers.get(self.id.get_access_plist().get_driver(), 'unknown')
+        return _driver_names.get(self.id.get_access_plist().get_driver(), 'unknown')
 
     @property
     @with_phil
@@ -268,7 +322,7 @@ class File(Group):
             write_intent |= h5f.ACC_SWMR_WRITE
         return 'r+' if self.id.get_intent() & write_intent else 'r'
 
-    @property
+    @cached_property
     @with_phil
     def libver(self):
         """File format version bounds (2-tuple: low, high)"""
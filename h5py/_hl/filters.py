@@ -38,9 +38,10 @@
         Tuple of available filter names for encoding
 """
 from collections.abc import Mapping
+from functools import lru_cache, reduce
+import math
 import operator
 
-import numpy as np
 from .compat import filename_encode
 from .. import h5z, h5p, h5d, h5f
 
@@ -52,9 +53,26 @@ _COMP_FILTERS = {'gzip': h5z.FILTER_DEFLATE,
                 'fletcher32': h5z.FILTER_FLETCHER32,
                 'scaleoffset': h5z.FILTER_SCALEOFFSET }
 
+# Filter names by code, for reporting the filters in a DCPL
+_FILTER_NAMES = {code: name for name, code in _COMP_FILTERS.items()}
+
+_SZIP_OPTION_MASKS = {'ec': h5z.SZIP_EC_OPTION_MASK, 'nn': h5z.SZIP_NN_OPTION_MASK}
+
+# Constants used on every dataset creation, resolved once at import
+_FILTER_DEFLATE = h5z.FILTER_DEFLATE
+_FILTER_SZIP = h5z.FILTER_SZIP
+_FILTER_LZF = h5z.FILTER_LZF
+_FLAG_OPTIONAL = h5z.FLAG_OPTIONAL
+_SZIP_EC = h5z.SZIP_EC_OPTION_MASK
+_SZIP_NN = h5z.SZIP_NN_OPTION_MASK
+_FILL_TIME_ALLOC = h5d.FILL_TIME_ALLOC
+_DCPL = h5p.DATASET_CREATE
+
 DEFAULT_GZIP = 4
+_GZIP_LEVELS = range(10)
 DEFAULT_SZIP = ('nn', 8)
 
+@lru_cache(maxsize=1)
 def _gen_filter_tuples():
     """ Bootstrap function to figure out what filters are available. """
     dec = []
@@ -69,7 +87,13 @@ def _gen_filter_tuples():
 
     return tuple(dec), tuple(enc)
 
-decode, encode = _gen_filter_tuples()
+def __getattr__(name):
+    # decode/encode are only probed from the library on first access
+    if name == 'decode':
+        return _gen_filter_tuples()[0]
+    if name == 'encode':
+        return _gen_filter_tuples()[1]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 def _external_entry(entry):
     """ Check for and return a well-formed entry tuple for
@@ -153,34 +177,36 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
             )
         if maxshape and maxshape != ():
             raise TypeError(f"{shapetype} datasets cannot be extended")
-        return h5p.create(h5p.DATASET_CREATE)
+        return h5p.create(_DCPL)
 
     def rq_tuple(tpl, name):
-        """ Check if chunks/maxshape match dataset rank """
-        if tpl in (None, True):
-            return
+        """ Check if chunks/maxshape match dataset rank, and return them as a
+        tuple (or None/True) """
+        if tpl is None or tpl is True:
+            return tpl
         try:
             tpl = tuple(tpl)
         except TypeError:
             raise TypeError('"%s" argument must be None or a sequence object' % name)
         if len(tpl) != len(shape):
             raise ValueError('"%s" must have same rank as dataset shape' % name)
+        return tpl
 
-    rq_tuple(chunks, 'chunks')
-    rq_tuple(maxshape, 'maxshape')
+    chunks = rq_tuple(chunks, 'chunks')
+    maxshape = rq_tuple(maxshape, 'maxshape')
 
     if compression is not None:
         if isinstance(compression, FilterRefBase):
             compression_opts = compression.filter_options
             compression = compression.filter_id
 
-        if compression not in encode and not isinstance(compression, int):
+        if compression not in _gen_filter_tuples()[1] and not isinstance(compression, int):
             raise ValueError('Compression filter "%s" is unavailable' % compression)
 
         if compression == 'gzip':
             if compression_opts is None:
                 gzip_level = DEFAULT_GZIP
-            elif compression_opts in range(10):
+            elif compression_opts in _GZIP_LEVELS:
                 gzip_level = compression_opts
             else:
                 raise ValueError("GZIP setting must be an integer from 0-9, not %r" % compression_opts)
@@ -198,7 +224,7 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
                 szmethod, szpix = compression_opts
             except TypeError:
                 raise TypeError(err)
-            if szmethod not in ('ec', 'nn'):
+            if szmethod not in _SZIP_OPTION_MASKS:
                 raise ValueError(err)
             if not (0<szpix<=32 and szpix%2 == 0):
                 raise ValueError(err)
@@ -238,8 +264,8 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
     # End argument validation
 
     if (chunks is True) or \
-    (chunks is None and any((shuffle, fletcher32, compression, maxshape,
-                             scaleoffset is not None))):
+    (chunks is None and (compression is not None or shuffle or fletcher32 or
+                         maxshape is not None or scaleoffset is not None)):
         chunks = guess_chunk(shape, maxshape, dtype.itemsize)
 
     if maxshape is True:
@@ -247,7 +273,7 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
 
     if chunks is not None:
         plist.set_chunk(chunks)
-        plist.set_fill_time(h5d.FILL_TIME_ALLOC)  # prevent resize glitch
+        plist.set_fill_time(_FILL_TIME_ALLOC)  # prevent resize glitch
 
     # scale-offset must come before shuffle and compression
     if scaleoffset is not None:
@@ -265,15 +291,14 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
     if compression == 'gzip':
         plist.set_deflate(gzip_level)
     elif compression == 'lzf':
-        plist.set_filter(h5z.FILTER_LZF, h5z.FLAG_OPTIONAL)
+        plist.set_filter(_FILTER_LZF, _FLAG_OPTIONAL)
     elif compression == 'szip':
-        opts = {'ec': h5z.SZIP_EC_OPTION_MASK, 'nn': h5z.SZIP_NN_OPTION_MASK}
-        plist.set_szip(opts[szmethod], szpix)
+        plist.set_szip(_SZIP_OPTION_MASKS[szmethod], szpix)
     elif isinstance(compression, int):
         if not allow_unknown_filter and not h5z.filter_avail(compression):
             raise ValueError("Unknown compression filter number: %s" % compression)
 
-        plist.set_filter(compression, h5z.FLAG_OPTIONAL, compression_opts)
+        plist.set_filter(compression, _FLAG_OPTIONAL, compression_opts)
 
     # `fletcher32` must come after `compression`, otherwise, if `compression`
     # is "szip" and the data is 64bit, the fletcher32 checksum will be wrong
@@ -290,43 +315,36 @@ def get_filters(plist):
     Undocumented and subject to change without warning.
     """
 
-    filters = {h5z.FILTER_DEFLATE: 'gzip', h5z.FILTER_SZIP: 'szip',
-               h5z.FILTER_SHUFFLE: 'shuffle', h5z.FILTER_FLETCHER32: 'fletcher32',
-               h5z.FILTER_LZF: 'lzf', h5z.FILTER_SCALEOFFSET: 'scaleoffset'}
-
     pipeline = {}
 
-    nfilters = plist.get_nfilters()
-
-    for i in range(nfilters):
-
-        code, _, vals, _ = plist.get_filter(i)
+    for code, _, vals, _ in plist.get_all_filters():
 
-        if code == h5z.FILTER_DEFLATE:
+        if code == _FILTER_DEFLATE:
             vals = vals[0] # gzip level
 
-        elif code == h5z.FILTER_SZIP:
+        elif code == _FILTER_SZIP:
             mask, pixels = vals[0:2]
-            if mask & h5z.SZIP_EC_OPTION_MASK:
+            if mask & _SZIP_EC:
                 mask = 'ec'
-            elif mask & h5z.SZIP_NN_OPTION_MASK:
+            elif mask & _SZIP_NN:
                 mask = 'nn'
             else:
                 raise TypeError("Unknown SZIP configuration")
             vals = (mask, pixels)
-        elif code == h5z.FILTER_LZF:
+        elif code == _FILTER_LZF:
             vals = None
         else:
             if len(vals) == 0:
                 vals = None
 
-        pipeline[filters.get(code, str(code))] = vals
+        pipeline[_FILTER_NAMES.get(code, str(code))] = vals
 
     return pipeline
 
 CHUNK_BASE = 16*1024    # Multiplier by which chunks are adjusted
 CHUNK_MIN = 8*1024      # Soft lower limit (8k)
 CHUNK_MAX = 1024*1024   # Hard upper limit (1M)
+_LOG10_2 = math.log10(2)
 
 def guess_chunk(shape, maxshape, typesize):
     """ Guess an appropriate chunk layout for a dataset, given its shape and
@@ -338,45 +356,46 @@ def guess_chunk(shape, maxshape, typesize):
     """
     # pylint: disable=unused-argument
 
-    # For unlimited dimensions we have to guess 1024
-    shape = tuple((x if x!=0 else 1024) for i, x in enumerate(shape))
-
     ndims = len(shape)
     if ndims == 0:
         raise ValueError("Chunks not allowed for scalar datasets.")
 
-    chunks = np.array(shape, dtype='=f8')
-    if not np.all(np.isfinite(chunks)):
+    if not all(math.isfinite(x) for x in shape):
         raise ValueError("Illegal value in chunk tuple")
 
+    # For unlimited dimensions we have to guess 1024.
+    # Plain Python ints: for a handful of axes, this is much quicker than
+    # doing the arithmetic with NumPy, and unsigned NumPy integers would
+    # wrap around in the rounding below.
+    chunks = [(int(x) if x!=0 else 1024) for x in shape]
+
     # Determine the optimal chunk size in bytes using a PyTables expression.
     # This is kept as a float.
-    dset_size = np.product(chunks)*typesize
-    target_size = CHUNK_BASE * (2**np.log10(dset_size/(1024.*1024)))
-
-    if target_size > CHUNK_MAX:
-        target_size = CHUNK_MAX
-    elif target_size < CHUNK_MIN:
-        target_size = CHUNK_MIN
+    # 2**log10(x) == x**log10(2), which needs only one libm call.
+    chunk_elements = reduce(operator.mul, chunks, 1)
+    dset_size = chunk_elements*typesize
+    target_size = CHUNK_BASE * (dset_size/(1024.*1024))**_LOG10_2
+    target_size = min(CHUNK_MAX, max(CHUNK_MIN, target_size))
+
+    # Repeatedly loop over the axes, dividing them by 2.  Stop when:
+    # 1a. We're smaller than the target chunk size, OR
+    # 1b. We're within 50% of the target chunk size, AND
+    #  2. The chunk is smaller than the maximum chunk size
+    # Together, 1a and 1b just mean smaller than 1.5 x the target size.
+    stop_below = min(1.5 * target_size, CHUNK_MAX)
 
     idx = 0
-    while True:
-        # Repeatedly loop over the axes, dividing them by 2.  Stop when:
-        # 1a. We're smaller than the target chunk size, OR
-        # 1b. We're within 50% of the target chunk size, AND
-        #  2. The chunk is smaller than the maximum chunk size
-
-        chunk_bytes = np.product(chunks)*typesize
-
-        if (chunk_bytes < target_size or \
-         abs(chunk_bytes-target_size)/target_size < 0.5) and \
-         chunk_bytes < CHUNK_MAX:
-            break
+    while chunk_elements*typesize >= stop_below:
 
-        if np.product(chunks) == 1:
+        if chunk_elements == 1:
             break  # Element size larger than CHUNK_MAX
 
-        chunks[idx%ndims] = np.ceil(chunks[idx%ndims] / 2.0)
+        # Each pass halves the first axis first, so when we stop part-way
+        # through a pass, the trailing (fastest-varying) axes stay larger.
+        axis = idx % ndims
+        old_length = chunks[axis]
+        chunks[axis] = -(-old_length // 2)  # Round up
+        chunk_elements = chunk_elements // old_length * chunks[axis]
         idx += 1
 
-    return tuple(int(x) for x in chunks)
+    return tuple(chunks)
@@ -11,6 +11,10 @@
     Implements support for high-level access to HDF5 groups.
 """
 
+try:
+    from functools import cached_property
+except ImportError:
+    from cached_property import cached_property
 import posixpath as pp
 import numpy
 
@@ -45,6 +49,11 @@ class Group(HLObject, MutableMappingHDF5):
     _gcpl_crt_order.set_attr_creation_order(
         h5p.CRT_ORDER_TRACKED | h5p.CRT_ORDER_INDEXED)
 
+    @cached_property
+    def _readonly(self):
+        """Whether the file was opened read-only; fixed while it is open"""
+        return self.file.mode == 'r'
+
 
     def create_group(self, name, track_order=None):
         """ Create and return a new subgroup.
@@ -133,6 +142,17 @@ class Group(HLObject, MutableMappingHDF5):
             (T/F) Do not check that the requested filter is available for use.
             This should only be used with ``write_direct_chunk``, where the caller
             compresses the data before handing it to h5py.
+        rdcc_nbytes
+            Total size of the dataset's raw data chunk cache in bytes.
+            Defaults to the file's setting.  The rdcc_* options only apply
+            to the returned object; the dataset uses the file's chunk cache
+            when opened again later.
+        rdcc_w0
+            The chunk preemption policy for this dataset.  This must be
+            between 0 and 1 inclusive.  Defaults to the file's setting.
+        rdcc_nslots
+            The number of chunk slots in the dataset's chunk cache.
+            Defaults to the file's setting.
         """
         if 'track_order' not in kwds:
             kwds['track_order'] = h5.get_config().track_order
@@ -145,8 +165,19 @@ class Group(HLObject, MutableMappingHDF5):
                     parent_path, name = name.rsplit(b'/', 1)
                     group = self.require_group(parent_path)
 
-            dsid = dataset.make_new_dset(group, shape, dtype, data, name, **kwds)
-            dset = dataset.Dataset(dsid)
+            # A creation property list we make ourselves describes the new
+            # dataset exactly, so Dataset needn't fetch it back from HDF5.
+            # One passed in by the caller stays theirs to modify.
+            dcpl = kwds.pop('dcpl', None)
+            own_dcpl = dcpl is None
+            if own_dcpl:
+                dcpl = h5p.create(h5p.DATASET_CREATE)
+
+            dsid, dcpl = dataset.make_new_dset(group, shape, dtype, data, name,
+                                               dcpl=dcpl, **kwds)
+            if not own_dcpl:
+                dcpl = dsid.get_create_plist()
+            dset = dataset.Dataset(dsid, _dcpl=dcpl)
             return dset
 
     if vds_support:
@@ -208,13 +239,15 @@ class Group(HLObject, MutableMappingHDF5):
         shape or dtype don't match according to the above rules.
         """
         with phil:
-            if not name in self:
+            # Opening directly is cheaper than checking `name in self` first
+            try:
+                dset = self[name]
+            except KeyError:
                 return self.create_dataset(name, *(shape, dtype), **kwds)
 
             if isinstance(shape, int):
                 shape = (shape,)
 
-            dset = self[name]
             if not isinstance(dset, dataset.Dataset):
                 raise TypeError("Incompatible object (%s) already exists" % dset.__class__.__name__)
 
@@ -269,9 +302,10 @@ class Group(HLObject, MutableMappingHDF5):
         isn't a group.
         """
         with phil:
-            if not name in self:
+            try:
+                grp = self[name]
+            except KeyError:
                 return self.create_group(name)
-            grp = self[name]
             if not isinstance(grp, Group):
                 raise TypeError("Incompatible object (%s) already exists" % grp.__class__.__name__)
             return grp
@@ -294,7 +328,7 @@ class Group(HLObject, MutableMappingHDF5):
         if otype == h5i.GROUP:
             return Group(oid)
         elif otype == h5i.DATASET:
-            return dataset.Dataset(oid, readonly=(self.file.mode == 'r'))
+            return dataset.Dataset(oid, readonly=self._readonly)
         elif otype == h5i.DATATYPE:
             return datatype.Datatype(oid)
         else:
@@ -495,7 +529,9 @@ class Group(HLObject, MutableMappingHDF5):
                     dest_path = pp.basename(h5i.get_name(source.id))
                 else:
                     # copy source into dest group: dest_name/source_name
-                    dest_path = pp.basename(h5i.get_name(source[source_path].id))
+                    # (only the name is needed, so skip the high-level wrapper)
+                    oid = h5o.open(source.id, source._e(source_path), lapl=source._lapl)
+                    dest_path = pp.basename(h5i.get_name(oid))
 
             elif isinstance(dest, HLObject):
                 raise TypeError("Destination must be path or Group object")
@@ -590,18 +626,60 @@ class Group(HLObject, MutableMappingHDF5):
         with phil:
             def proxy(name):
                 """ Use the text name of the object, not bytes """
-                name = self._d(name)
-                return func(name, self[name])
+                return func(self._d(name), self[name])
             return h5o.visit(self.id, proxy)
 
+    def visit_links(self, func):
+        """ Recursively visit all links in this group and subgroups.
+
+        Like visit(), but walks links rather than objects: soft and external
+        links are passed to func (without being followed), and an object
+        with several hard links is seen once per link, though a group's
+        members are only walked the first time it is reached.  HDF5 doesn't
+        read the object headers to do this, so collecting names this way is
+        considerably faster than with visit().
+
+        Returning None or a false value continues iteration, returning
+        anything else stops and immediately returns that value.
+
+        Example:
+
+        >>> # List every link in the file
+        >>> f = File("foo.hdf5")
+        >>> list_of_names = []
+        >>> f.visit_links(list_of_names.append)
+        """
+        with phil:
+            def proxy(name):
+                """ Call the function with the text name, not bytes """
+                return func(self._d(name))
+            return self.id.links.visit(proxy)
+
+    def visititems_links(self, func):
+        """ Recursively visit links in this group and subgroups.
+
+        Like visit_links(), but func has the signature:
+
+            func(<link name>, <link>) => <None or return value>
+
+        where <link> is a HardLink, SoftLink or ExternalLink instance.
+        """
+        with phil:
+            def proxy(name):
+                """ Use the text name of the link, not bytes """
+                name = self._d(name)
+                return func(name, self.get(name, getlink=True))
+            return self.id.links.visit(proxy)
+
     @with_phil
     def __repr__(self):
         if not self:
             r = u"<Closed HDF5 group>"
         else:
+            name = self.name
             namestr = (
-                '"%s"' % self.name
-            ) if self.name is not None else u"(anonymous)"
+                '"%s"' % name
+            ) if name is not None else u"(anonymous)"
             r = '<HDF5 group %s (%d members)>' % (namestr, len(self))
 
         return r
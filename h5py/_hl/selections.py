@@ -11,10 +11,27 @@
     High-level access to HDF5 dataspace selections
 """
 
+try:
+    from functools import cached_property
+except ImportError:
+    from cached_property import cached_property
+
 import numpy as np
 
 from .base import product
-from .. import h5s, h5r, _selector
+from .. import h5, h5s, h5r, _selector
+from .. import version
+
+# H5Sis_regular_hyperslab was added along with virtual datasets
+_regular_hyperslab_support = (
+    version.hdf5_version_tuple[0:3] >= h5.get_config().vds_min_hdf5_version
+)
+
+# H5Sselect_copy, for resetting a scratch dataspace's selection
+_select_copy_support = version.hdf5_version_tuple[0:3] >= (1, 10, 6)
+
+# Broadcast tile offsets are computed this many at a time
+_TILE_BATCH = 4096
 
 def select(shape, args, dataset=None):
     """ High-level routine to generate a selection from arbitrary arguments
@@ -44,7 +61,7 @@ def select(shape, args, dataset=None):
     Indices, slices, ellipses, MultiBlockSlices only
         Returns a SimpleSelection instance
 
-    Indices, slices, ellipses, lists or boolean index arrays
+    Indices, slices, ellipses, lists or 1D boolean index arrays
         Returns a FancySelection instance.
     """
     if not isinstance(args, tuple):
@@ -174,14 +191,16 @@ class PointSelection(Selection):
 
     def _perform_selection(self, points, op):
         """ Internal method which actually performs the selection """
+        # No copy if points is already a C-ordered uint64 array
         points = np.asarray(points, order='C', dtype='u8')
-        if len(points.shape) == 1:
-            points.shape = (1,points.shape[0])
+        if points.ndim == 1:
+            # A single point; reshape a view so the caller's array is untouched
+            points = points.reshape((1, points.shape[0]))
 
         if self._id.get_select_type() != h5s.SEL_POINTS:
             op = h5s.SELECT_SET
 
-        if len(points) == 0:
+        if points.size == 0:
             self._id.select_none()
         else:
             self._id.select_elements(points, op)
@@ -192,7 +211,12 @@ class PointSelection(Selection):
         if not (isinstance(mask, np.ndarray) and mask.dtype.kind == 'b'):
             raise TypeError("PointSelection.from_mask only works with bool arrays")
 
-        points = np.transpose(mask.nonzero())
+        # Fill the (N, rank) coordinate array in its final dtype, so it isn't
+        # copied again when the selection is made
+        indices = mask.nonzero()
+        points = np.empty((len(indices[0]), len(indices)), dtype='u8')
+        for i, axis_indices in enumerate(indices):
+            points[:, i] = axis_indices
         return cls(mask.shape, spaceid, points=points)
 
     def append(self, points):
@@ -219,10 +243,11 @@ class SimpleSelection(Selection):
         """ Shape of current selection """
         return self._sel[1]
 
-    @property
+    @cached_property
     def array_shape(self):
-        scalar = self._sel[3]
-        return tuple(x for x, s in zip(self.mshape, scalar) if not s)
+        # The hyperslab is fixed once the selection is made
+        _, mshape, _, scalar = self._sel
+        return tuple(x for x, s in zip(mshape, scalar) if not s)
 
     def __init__(self, shape, spaceid=None, hyperslab=None):
         super().__init__(shape, spaceid)
@@ -250,26 +275,26 @@ class SimpleSelection(Selection):
         start, count, step, scalar = self._sel
 
         rank = len(count)
-        remaining_src_dims = list(source_shape)
-
-        eshape = []
-        for idx in range(1, rank + 1):
-            if len(remaining_src_dims) == 0 or scalar[-idx]:  # Skip scalar axes
-                eshape.append(1)
+        src_ix = len(source_shape) - 1   # Next source dimension to match
+
+        # Walk both shapes from the last axis backwards
+        eshape = [1] * rank
+        for idx in range(rank - 1, -1, -1):
+            if src_ix < 0 or scalar[idx]:  # Skip scalar axes
+                continue
+            t = source_shape[src_ix]
+            src_ix -= 1
+            if t == 1 or count[idx] == t:
+                eshape[idx] = t
             else:
-                t = remaining_src_dims.pop()
-                if t == 1 or count[-idx] == t:
-                    eshape.append(t)
-                else:
-                    raise TypeError("Can't broadcast %s -> %s" % (source_shape, self.array_shape))  # array shape
-
-        if any([n > 1 for n in remaining_src_dims]):
-            # All dimensions from target_shape should either have been popped
-            # to match the selection shape, or be 1.
+                raise TypeError("Can't broadcast %s -> %s" % (source_shape, self.array_shape))  # array shape
+
+        if any(source_shape[i] > 1 for i in range(src_ix + 1)):
+            # All dimensions from target_shape should either have been matched
+            # to the selection shape, or be 1.
             raise TypeError("Can't broadcast %s -> %s" % (source_shape, self.array_shape))  # array shape
 
-        # We have built eshape backwards, so now reverse it
-        return tuple(eshape[::-1])
+        return tuple(eshape)
 
 
     def broadcast(self, source_shape):
@@ -298,10 +323,15 @@ class SimpleSelection(Selection):
         else:
             sid = self._id.copy()
             sid.select_hyperslab((0,)*rank, tshape, step)
-            for idx in range(nchunks):
-                offset = tuple(x*y*z + s for x, y, z, s in zip(np.unravel_index(idx, chunks), tshape, step, start))
-                sid.offset_simple(offset)
-                yield sid
+            tile = np.array(tshape, dtype=np.int64) * step
+            # Offsets of the tiles in C order, computed a batch at a time
+            # so memory use doesn't grow with the number of tiles
+            for first in range(0, nchunks, _TILE_BATCH):
+                idx = np.arange(first, min(first + _TILE_BATCH, nchunks))
+                grid = np.stack(np.unravel_index(idx, chunks), axis=1)
+                for offset in (grid * tile + start).tolist():
+                    sid.offset_simple(tuple(offset))
+                    yield sid
 
 
 class FancySelection(Selection):
@@ -392,11 +422,19 @@ def guess_shape(sid):
     if N == 0:
         return (0,)*rank
 
+    if _regular_hyperslab_support and sid.is_regular_hyperslab():
+        # A single regular hyperslab: read the shape straight from HDF5
+        _, _, count, block = sid.get_regular_hyperslab()
+        return tuple(c * b for c, b in zip(count, block))
+
     bottomcorner, topcorner = (np.array(x) for x in sid.get_select_bounds())
 
     # Shape of full selection box
     boxshape = topcorner - bottomcorner + np.ones((rank,))
 
+    # Dataspace to mask off each axis in turn, reused where possible
+    scratch_sid = sid.copy() if _select_copy_support else None
+
     def get_n_axis(sid, axis):
         """ Determine the number of elements selected along a particular axis.
 
@@ -417,7 +455,11 @@ def guess_shape(sid):
         count[axis] -= 1
 
         # Throw away all points along this axis
-        masked_sid = sid.copy()
+        if scratch_sid is not None:
+            masked_sid = scratch_sid
+            masked_sid.select_copy(sid)
+        else:
+            masked_sid = sid.copy()
         masked_sid.select_hyperslab(tuple(start), tuple(count), op=h5s.SELECT_NOTB)
 
         N_leftover = masked_sid.get_select_npoints()
@@ -427,7 +469,7 @@ def guess_shape(sid):
 
     shape = tuple(get_n_axis(sid, x) for x in range(rank))
 
-    if np.product(shape) != N:
+    if product(shape) != N:
         # This means multiple hyperslab selections are in effect,
         # so we fall back to a 1D shape
         return (N,)
@@ -9,6 +9,8 @@ Python & numpy distinguish indexing a[3] from slicing a single element a[3:4],
 but there is no equivalent to this when selecting data in HDF5. So we store a
 separate boolean ('scalar') for each dimension to distinguish these cases.
 """
+include "config.pxi"
+
 from numpy cimport (
     ndarray, npy_intp, PyArray_SimpleNew, PyArray_DATA, import_array,
     PyArray_IsNativeByteOrder,
@@ -24,6 +26,10 @@ from .utils cimport emalloc, efree, convert_dims
 
 import_array()
 
+# Below this many indices, a fancy selection is built one hyperslab at a time;
+# longer index arrays are split in half & the selections merged.
+DEF FANCY_MERGE_THRESHOLD = 16
+
 
 cdef object convert_bools(bint* data, hsize_t rank):
     # Convert a bint array to a Python tuple of bools.
@@ -179,6 +185,11 @@ cdef class Selector:
                     a = np.asarray(a)
                 if a.ndim != 1:
                     raise TypeError("Only 1D arrays allowed for fancy indexing")
+                if a.dtype.kind == 'b':
+                    # [mask, :] - boolean mask along one axis
+                    if a.shape[0] != l:
+                        raise TypeError("Boolean indexing array has incompatible shape")
+                    a = a.nonzero()[0]
                 if not np.issubdtype(a.dtype, np.integer):
                     raise TypeError("Indexing arrays must have integer dtypes")
                 if array_ix != -1:
@@ -237,9 +248,14 @@ cdef class Selector:
         """Apply a 'fancy' selection (array of indices) to the dataspace"""
         cdef hsize_t* tmp_start
         cdef hsize_t* tmp_count
-        cdef uint64_t i
+        cdef ndarray indices
+        cdef hsize_t* indices_p
+        cdef hsize_t n
+        cdef hid_t merged
 
-        H5Sselect_none(self.space)
+        indices = np.ascontiguousarray(array_arg, dtype=np.uint64)
+        indices_p = <hsize_t*>PyArray_DATA(indices)
+        n = indices.shape[0]
 
         tmp_start = <hsize_t*>emalloc(sizeof(hsize_t) * self.rank)
         tmp_count = <hsize_t*>emalloc(sizeof(hsize_t) * self.rank)
@@ -248,14 +264,71 @@ cdef class Selector:
             memcpy(tmp_count, self.count, sizeof(hsize_t) * self.rank)
             tmp_count[array_ix] = 1
 
-            # Iterate over the array of indices, add each hyperslab to the selection
-            for i in array_arg:
-                tmp_start[array_ix] = i
-                H5Sselect_hyperslab(self.space, H5S_SELECT_OR, tmp_start, self.stride, tmp_count, self.block)
+            IF HDF5_VERSION >= (1, 10, 6):
+                # Adding one hyperslab at a time to a selection is quadratic
+                # in HDF5, so for longer index arrays, build selections for
+                # each half separately and merge them.
+                if n > FANCY_MERGE_THRESHOLD:
+                    merged = self.fancy_space(array_ix, tmp_start, tmp_count, indices_p, n)
+                    try:
+                        H5Sselect_copy(self.space, merged)
+                    finally:
+                        H5Sclose(merged)
+                    return
+
+            self.select_indices(self.space, array_ix, tmp_start, tmp_count, indices_p, n)
         finally:
             efree(tmp_start)
             efree(tmp_count)
 
+    cdef select_indices(self, hid_t space, int array_ix, hsize_t* tmp_start,
+                        hsize_t* tmp_count, hsize_t* indices, hsize_t n):
+        """Select one hyperslab per index in space, replacing its selection"""
+        cdef hsize_t i
+
+        H5Sselect_none(space)
+
+        # Iterate over the array of indices, add each hyperslab to the selection
+        for i in range(n):
+            tmp_start[array_ix] = indices[i]
+            H5Sselect_hyperslab(space, H5S_SELECT_OR, tmp_start, self.stride, tmp_count, self.block)
+
+    IF HDF5_VERSION >= (1, 10, 6):
+
+        cdef hid_t fancy_space(self, int array_ix, hsize_t* tmp_start,
+                               hsize_t* tmp_count, hsize_t* indices, hsize_t n) except -1:
+            """Return a new dataspace with a fancy selection of n indices
+
+            Splits the indices in half recursively, merging the two halves'
+            selections, to avoid HDF5's quadratic cost of growing a selection
+            one hyperslab at a time.
+            """
+            cdef hid_t space, other
+            cdef hsize_t half
+
+            if n <= FANCY_MERGE_THRESHOLD:
+                space = H5Scopy(self.space)
+                try:
+                    self.select_indices(space, array_ix, tmp_start, tmp_count, indices, n)
+                except:
+                    H5Sclose(space)
+                    raise
+                return space
+
+            half = n // 2
+            space = self.fancy_space(array_ix, tmp_start, tmp_count, indices, half)
+            try:
+                other = self.fancy_space(array_ix, tmp_start, tmp_count,
+                                         indices + half, n - half)
+                try:
+                    H5Smodify_select(space, H5S_SELECT_OR, other)
+                finally:
+                    H5Sclose(other)
+            except:
+                H5Sclose(space)
+                raise
+            return space
+
 
     def make_selection(self, tuple args):
         """Apply indexing/slicing args and create a high-level selection object
@@ -309,7 +382,7 @@ cdef class Reader:
         h5_stored_datatype = typewrap(H5Dget_type(self.dataset))
         np_dtype = h5_stored_datatype.py_dtype()
         self.np_typenum = np_dtype.num
-        self.native_byteorder = PyArray_IsNativeByteOrder(np_dtype.byteorder)
+        self.native_byteorder = PyArray_IsNativeByteOrder(ord(np_dtype.byteorder))
         self.h5_memory_datatype = py_create(np_dtype)
 
     cdef ndarray make_array(self, hsize_t* mshape):
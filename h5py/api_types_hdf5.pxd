@@ -413,6 +413,10 @@ cdef extern from "hdf5.h":
   unsigned int H5O_COPY_PRESERVE_NULL_FLAG        # (0x0020u) Copy NULL messages (empty space)
   unsigned int H5O_COPY_ALL                       # (0x003Fu) All object copying flags (for internal checking)
 
+  # Fields of H5O_info_t to fill in (H5Oget_info2 etc., HDF5 1.10.3)
+  unsigned int H5O_INFO_BASIC     # (0x0001u) fileno, addr, type, and rc
+  unsigned int H5O_INFO_ALL       # (0x001Fu) Everything
+
   # --- Components for the H5O_info_t struct ----------------------------------
 
   ctypedef struct space:
@@ -492,6 +492,10 @@ IF HDF5_VERSION >= (1, 8, 5):
         """
         from . import h5o
 
+        # Fast path: a plain member name needs just one link lookup
+        if isinstance(path, bytes) and b'/' not in path and path not in (b'', b'.'):
+            return grp.links.exists(path, lapl=lapl)
+
         if isinstance(path, bytes):
             path = path.decode('utf-8')
         else:
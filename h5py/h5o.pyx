@@ -352,7 +352,14 @@ def visit(ObjectID loc not None, object func, *,
     else:
         cfunc = cb_obj_simple
 
-    H5Ovisit_by_name(loc.id, obj_name, <H5_index_t>idx_type,
-        <H5_iter_order_t>order, cfunc, <void*>visit, pdefault(lapl))
+    IF HDF5_VERSION >= (1, 10, 3):
+        # Without info, only ask HDF5 for the basic fields, so it doesn't
+        # read header and attribute details for every object visited.
+        H5Ovisit_by_name2(loc.id, obj_name, <H5_index_t>idx_type,
+            <H5_iter_order_t>order, cfunc, <void*>visit,
+            H5O_INFO_ALL if info else H5O_INFO_BASIC, pdefault(lapl))
+    ELSE:
+        H5Ovisit_by_name(loc.id, obj_name, <H5_index_t>idx_type,
+            <H5_iter_order_t>order, cfunc, <void*>visit, pdefault(lapl))
 
     return visit.retval
@@ -400,6 +400,28 @@ cdef class PropFCID(PropOCID):
             return (strategy, persist, threshold)
 
 
+cdef tuple _get_filter_info(hid_t plist, int filter_idx):
+    # Shared by get_filter() and get_all_filters()
+    cdef list vlist
+    cdef int filter_code
+    cdef unsigned int flags
+    cdef size_t nelements
+    cdef unsigned int cd_values[16]
+    cdef char name[257]
+    cdef int i
+    nelements = 16 # HDF5 library actually complains if this is too big.
+
+    filter_code = <int>H5Pget_filter(plist, filter_idx, &flags,
+                                     &nelements, cd_values, 256, name, NULL)
+    name[256] = c'\0'  # in case it's > 256 chars
+
+    vlist = []
+    for i in range(nelements):
+        vlist.append(cd_values[i])
+
+    return (filter_code, flags, tuple(vlist), name)
+
+
 # Dataset creation
 cdef class PropDCID(PropOCID):
 
@@ -648,27 +670,22 @@ cdef class PropDCID(PropOCID):
         2. TUPLE of UINT values; filter aux data (16 values max)
         3. STRING name of filter (256 chars max)
         """
-        cdef list vlist
-        cdef int filter_code
-        cdef unsigned int flags
-        cdef size_t nelements
-        cdef unsigned int cd_values[16]
-        cdef char name[257]
-        cdef int i
-        nelements = 16 # HDF5 library actually complains if this is too big.
-
         if filter_idx < 0:
             raise ValueError("Filter index must be a non-negative integer")
 
-        filter_code = <int>H5Pget_filter(self.id, filter_idx, &flags,
-                                         &nelements, cd_values, 256, name, NULL)
-        name[256] = c'\0'  # in case it's > 256 chars
+        return _get_filter_info(self.id, filter_idx)
 
-        vlist = []
-        for i in range(nelements):
-            vlist.append(cd_values[i])
 
-        return (filter_code, flags, tuple(vlist), name)
+    @with_phil
+    def get_all_filters(self):
+        """() => LIST of TUPLE filter_info
+
+        Get information about every filter in the pipeline, in order.
+        Each entry is a tuple as returned by get_filter().
+        """
+        cdef int i, nfilters
+        nfilters = H5Pget_nfilters(self.id)
+        return [_get_filter_info(self.id, i) for i in range(nfilters)]
 
 
     @with_phil
@@ -1736,6 +1753,24 @@ cdef class PropDXID(PropInstanceID):
 
     """ Data transfer property list """
 
+    @with_phil
+    def set_buffer(self, size_t size):
+        """(UINT size)
+
+        Set the size in bytes of the type conversion and background
+        buffers, which HDF5 allocates for each read or write needing
+        them.  The default is 1 MiB.
+        """
+        H5Pset_buffer(self.id, size, NULL, NULL)
+
+    @with_phil
+    def get_buffer(self):
+        """() => UINT size
+
+        Get the size in bytes of the type conversion and background buffers.
+        """
+        return H5Pget_buffer(self.id, NULL, NULL)
+
     IF MPI:
         def set_dxpl_mpio(self, int xfer_mode):
             """ Set the transfer mode for MPI I/O.
@@ -628,3 +628,79 @@ cdef class SpaceID(ObjectID):
                 efree(stride_array)
                 efree(count_array)
                 efree(block_array)
+
+    # === Combining selections ================================================
+
+    IF HDF5_VERSION >= (1, 10, 6):
+
+        @with_phil
+        def select_copy(self, SpaceID source not None):
+            """(SpaceID source)
+
+            Replace this dataspace's selection with a copy of the selection
+            in another dataspace.  Both must have the same extent.
+            """
+            H5Sselect_copy(self.id, source.id)
+
+        @with_phil
+        def modify_select(self, SpaceID other not None, int op=H5S_SELECT_OR):
+            """(SpaceID other, INT op=SELECT_OR)
+
+            Combine the hyperslab selection of another dataspace into this
+            one, in place.  Both selections must be hyperslabs.
+            """
+            H5Smodify_select(self.id, <H5S_seloper_t>op, other.id)
+
+        @with_phil
+        def combine_select(self, SpaceID other not None, int op=H5S_SELECT_OR):
+            """(SpaceID other, INT op=SELECT_OR) => SpaceID
+
+            Return a new dataspace whose selection combines the hyperslab
+            selections of this dataspace and another one.
+            """
+            return SpaceID(H5Scombine_select(self.id, <H5S_seloper_t>op, other.id))
+
+        @with_phil
+        def combine_hyperslab(self, object start, object count, object stride=None,
+                              object block=None, int op=H5S_SELECT_OR):
+            """(TUPLE start, TUPLE count, TUPLE stride=None, TUPLE block=None,
+                 INT op=SELECT_OR) => SpaceID
+
+            Like select_hyperslab, but return a new dataspace with the
+            combined selection and leave this one unchanged.
+            """
+            cdef int rank
+            cdef hsize_t* start_array = NULL
+            cdef hsize_t* count_array = NULL
+            cdef hsize_t* stride_array = NULL
+            cdef hsize_t* block_array = NULL
+
+            rank = H5Sget_simple_extent_ndims(self.id)
+
+            require_tuple(start, 0, rank, b"start")
+            require_tuple(count, 0, rank, b"count")
+            require_tuple(stride, 1, rank, b"stride")
+            require_tuple(block, 1, rank, b"block")
+
+            try:
+                start_array = <hsize_t*>emalloc(sizeof(hsize_t)*rank)
+                count_array = <hsize_t*>emalloc(sizeof(hsize_t)*rank)
+                convert_tuple(start, start_array, rank)
+                convert_tuple(count, count_array, rank)
+
+                if stride is not None:
+                    stride_array = <hsize_t*>emalloc(sizeof(hsize_t)*rank)
+                    convert_tuple(stride, stride_array, rank)
+                if block is not None:
+                    block_array = <hsize_t*>emalloc(sizeof(hsize_t)*rank)
+                    convert_tuple(block, block_array, rank)
+
+                return SpaceID(H5Scombine_hyperslab(self.id, <H5S_seloper_t>op,
+                                                    start_array, stride_array,
+                                                    count_array, block_array))
+
+            finally:
+                efree(start_array)
+                efree(count_array)
+                efree(stride_array)
+                efree(block_array)
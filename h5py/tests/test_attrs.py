@@ -62,6 +62,14 @@ class TestAccess(BaseAttrs):
         self.assertEqual(list(self.f.attrs.keys()), ['a'])
         self.assertEqual(self.f.attrs['a'], 4.0)
 
+    def test_manager_reused(self):
+        """ Each object keeps a single AttributeManager """
+        grp = self.f.create_group('grp')
+        self.assertIs(grp.attrs, grp.attrs)
+        self.assertIs(self.f.attrs, self.f.attrs)
+        self.f.attrs['a'] = 1
+        self.assertEqual(self.f['/'].attrs['a'], 1)
+
     def test_create_2(self):
         """ Attribute creation by create() method """
         self.f.attrs.create('a', 4.0)
@@ -55,6 +55,43 @@ class TestScalar(BaseAttrs):
         self.assertEqual(out, data)
         self.assertEqual(out['b'], data['b'])
 
+    def test_numbers(self):
+        """ Python and NumPy numbers keep their types, however often written """
+        for value in [3, 2.5, 1+2j, True, np.float32(1.5), np.uint16(7),
+                      np.bool_(False), 4, np.float32(-1)]:
+            self.f.attrs['x'] = value
+            out = self.f.attrs['x']
+            self.assertEqual(out, value)
+            self.assertEqual(out.dtype, np.asarray(value).dtype)
+
+        self.f.attrs['x'] = np.bytes_(b'abc')
+        self.assertEqual(self.f.attrs['x'], b'abc')
+
+    def test_enum_after_int(self):
+        """ Enum types aren't mistaken for a plain integer type """
+        dt = h5py.enum_dtype({'RED': 0, 'GREEN': 1}, basetype='i1')
+        self.f.attrs.create('x', 1, dtype='i1')
+        self.f.attrs.create('y', 1, dtype=dt)
+        self.assertIsNone(h5py.check_enum_dtype(self.f.attrs.get_id('x').dtype))
+        self.assertEqual(h5py.check_enum_dtype(self.f.attrs.get_id('y').dtype),
+                         {'RED': 0, 'GREEN': 1})
+
+    def test_complex_names_change(self):
+        """ Complex attributes are stored with the current complex_names """
+        cfg = h5py.get_config()
+        self.f.attrs['x'] = 1+2j
+        try:
+            cfg.complex_names = ('real', 'imag')
+            self.f.attrs['y'] = 3+4j
+            self.assertEqual(self.f.attrs['y'], 3+4j)
+        finally:
+            cfg.complex_names = ('r', 'i')
+
+        for name, members in [('x', (b'r', b'i')), ('y', (b'real', b'imag'))]:
+            tid = self.f.attrs.get_id(name).get_type()
+            self.assertEqual((tid.get_member_name(0), tid.get_member_name(1)),
+                             members)
+
 
 class TestArray(BaseAttrs):
 
@@ -260,3 +297,12 @@ class TestWriteException(BaseAttrs):
 
         with self.assertRaises(KeyError):
             self.f.attrs['x']
+
+    def test_overwrite(self):
+        """ Failed overwrite leaves the old attribute in place """
+
+        self.f.attrs['x'] = 42
+        with self.assertRaises(ValueError):
+            self.f.attrs['x'] = b"Hello\x00Hello"
+        self.assertEqual(self.f.attrs['x'], 42)
+        self.assertEqual(list(self.f.attrs), ['x'])
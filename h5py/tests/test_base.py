@@ -61,6 +61,10 @@ class TestParent(BaseTest):
         parent = sub_grp.parent.name
         self.assertEqual(parent, "/bar")
 
+        # Objects at the top level, and the root group itself
+        self.assertEqual(grp.parent.name, "/")
+        self.assertEqual(self.f["/"].parent.name, "/")
+
 class TestMapping(BaseTest):
 
     """
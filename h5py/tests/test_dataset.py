@@ -52,6 +52,11 @@ class TestRepr(BaseDataset):
         self.f.close()
         self.assertIsInstance(repr(ds), str)
 
+    def test_repr_name(self):
+        """ repr() shows the last component of the name """
+        ds = self.f.create_dataset('grp/foo', (4,))
+        self.assertIn('"foo"', repr(ds))
+
 
 class TestCreateShape(BaseDataset):
 
@@ -242,6 +247,13 @@ class TestReadDirectly:
         dset.read_direct(arr)
         np.testing.assert_array_equal(arr, np.arange(10, dtype="int64"))
 
+    def test_convert(self, writable_file):
+        dset = writable_file.create_dataset("dset", (10, 5), data=np.arange(50, dtype="int64").reshape(10, 5))
+        for dt in ("float32", "int16", "float32"):
+            arr = np.zeros((3, 5), dtype=dt)
+            dset.read_direct(arr, np.s_[2:5])
+            np.testing.assert_array_equal(arr, np.arange(10, 25).reshape(3, 5))
+
     def test_empty(self, writable_file):
         empty_dset = writable_file.create_dataset("edset", dtype='int64')
         arr = np.ones((100,), 'int64')
@@ -300,6 +312,40 @@ class TestWriteDirectly:
             dset.write_direct(arr)
 
 
+class TestWriteWholeChunk:
+
+    """
+        Feature: Assigning exactly one chunk gives the same result whether
+        or not it can bypass HDF5's conversion pipeline
+    """
+
+    @pytest.mark.parametrize('dtype, kwds', [
+        ('<f4', {}),
+        ('>i4', {}),
+        ('<f8', {'compression': 'gzip'}),
+        ('<f8', {'fletcher32': True}),
+    ])
+    def test_chunk_write(self, writable_file, dtype, kwds):
+        dset = writable_file.create_dataset('x', (8, 6), dtype=dtype,
+                                            chunks=(4, 3), **kwds)
+        expected = np.zeros((8, 6), dtype=dtype)
+        dset[0, 0] = 7    # Leave a modified chunk in the chunk cache
+        expected[0, 0] = 7
+        for sl in (np.s_[0:4, 0:3], np.s_[4:8, 3:6], np.s_[4:, :3]):
+            val = np.arange(12, dtype=dtype).reshape(4, 3) + sl[0].start
+            dset[sl] = val
+            expected[sl] = val
+        np.testing.assert_array_equal(dset[:], expected)
+
+    def test_read_only(self, writable_file):
+        dset = writable_file.create_dataset('x', (4,), dtype='f4', chunks=(2,))
+        fname = writable_file.filename
+        writable_file.close()
+        with File(fname, 'r') as f:
+            with pytest.raises(OSError):
+                Dataset(f['x'].id)[0:2] = np.ones(2, dtype='f4')
+
+
 class TestCreateRequire(BaseDataset):
 
     """
@@ -378,6 +424,54 @@ class TestCreateChunked(BaseDataset):
         dset = self.f.create_dataset('foo', shape=(100,), chunks=(10,))
         self.assertEqual(dset.chunks, (10,))
 
+    def test_create_chunks_sequence(self):
+        """ Create via chunks given as a generator or an array """
+        dset = self.f.create_dataset('foo', shape=(100, 100),
+                                     chunks=(x for x in (10, 20)))
+        self.assertEqual(dset.chunks, (10, 20))
+        dset = self.f.create_dataset('bar', shape=(100, 100),
+                                     chunks=np.array([10, 20]))
+        self.assertEqual(dset.chunks, (10, 20))
+
+    def test_create_matches_reopened(self):
+        """ Storage properties of a new dataset match a fresh binding """
+        dset = self.f.create_dataset('foo', shape=(100,), chunks=(10,),
+                                     maxshape=(None,), fletcher32=True,
+                                     fillvalue=2.0)
+        reopened = Dataset(dset.id)
+        for prop in ('chunks', 'maxshape', 'fletcher32', 'shuffle',
+                     'compression', 'fillvalue', 'external'):
+            self.assertEqual(getattr(dset, prop), getattr(reopened, prop))
+
+    def test_create_matches_reopened_scalar(self):
+        """ Scalar and empty datasets keep their fill value and settings """
+        scalar = self.f.create_dataset('scalar', shape=(), dtype='i4',
+                                       fillvalue=5)
+        empty = self.f.create_dataset('empty', data=h5py.Empty('i4'),
+                                      fillvalue=3)
+        self.assertEqual(scalar.fillvalue, 5)
+        self.assertEqual(empty.fillvalue, 3)
+        for dset in (scalar, empty):
+            reopened = Dataset(dset.id)
+            for prop in ('chunks', 'maxshape', 'fletcher32', 'shuffle',
+                         'compression', 'fillvalue', 'external'):
+                self.assertEqual(getattr(dset, prop), getattr(reopened, prop))
+
+    def test_chunk_cache(self):
+        """ Chunk cache settings for a new dataset """
+        dset = self.f.create_dataset('foo', (100, 100), chunks=(10, 10),
+                                     rdcc_nbytes=2**22, rdcc_w0=0.25)
+        _, nslots, _, _ = self.f.id.get_access_plist().get_cache()
+        self.assertEqual(dset.id.get_access_plist().get_chunk_cache(),
+                         (nslots, 2**22, 0.25))
+
+    def test_chunk_cache_default(self):
+        """ Without rdcc_* options, large chunks use the file's chunk cache """
+        dset = self.f.create_dataset('foo', (128, 128, 128), 'f8',
+                                     chunks=(64, 64, 64))
+        nbytes = dset.id.get_access_plist().get_chunk_cache()[1]
+        self.assertEqual(nbytes, self.f.id.get_access_plist().get_cache()[2])
+
     def test_create_chunks_integer(self):
         """ Create via chunks integer """
         dset = self.f.create_dataset('foo', shape=(100,), chunks=10)
@@ -946,6 +1040,8 @@ class TestResize(BaseDataset):
         self.assertEqual(dset.shape, (20, 50))
         dset.resize((20, 60))
         self.assertEqual(dset.shape, (20, 60))
+        self.assertEqual(dset.maxshape, (20, 60))
+        self.assertEqual(dset.ndim, 2)
 
     def test_resize_1D(self):
         """ Datasets may be resized up to maxshape using integer maxshape"""
@@ -1034,6 +1130,20 @@ class TestIter(BaseDataset):
             self.assertEqual(len(x), 3)
             self.assertArrayEqual(x, y)
 
+    def test_iter_blocks(self):
+        """ Iteration reading several blocks of rows yields every row """
+        data = np.arange(2 ** 18, dtype='i8').reshape((2 ** 14, 16))
+        dset = self.f.create_dataset('foo', data=data, chunks=(1000, 16))
+        rows = list(dset)
+        self.assertEqual(len(rows), len(data))
+        self.assertArrayEqual(np.array(rows), data)
+
+    def test_iter_1d(self):
+        """ Iterating over a 1D dataset yields scalars """
+        data = np.arange(10, dtype='f')
+        dset = self.f.create_dataset('foo', data=data)
+        self.assertEqual(list(dset), list(data))
+
     def test_iter_scalar(self):
         """ Iterating over scalar dataset raises TypeError """
         dset = self.f.create_dataset('foo', shape=())
@@ -1274,6 +1384,44 @@ class TestCompound(BaseDataset):
             self.f['test'].fields('x')[:], testdata['x']
         )
 
+    def test_fields_repeated(self):
+        """ Repeated field reads, with and without astype """
+        dt = np.dtype([('x', np.float64), ('y', np.int32)])
+        testdata = np.zeros((16,), dtype=dt)
+        testdata['x'] = np.arange(16) + 0.5
+        testdata['y'] = np.arange(16)
+        dset = self.f.create_dataset('test', data=testdata)
+
+        for i in range(3):
+            np.testing.assert_array_equal(dset['y', 'x', i:], testdata[['y', 'x']][i:])
+            np.testing.assert_array_equal(dset['x', i], testdata['x'][i])
+        self.assertEqual(dset.fields(['y', 'x']).read_dtype.names, ('y', 'x'))
+
+        adt = np.dtype([('x', np.int16), ('y', np.float32)])
+        out = dset.astype(adt)['x', :]
+        self.assertEqual(out.dtype, np.int16)
+        np.testing.assert_array_equal(out, testdata['x'].astype(np.int16))
+
+    def test_fields_buffer_sizes(self):
+        """ Field reads and writes of any size convert correctly """
+        dt = np.dtype([('x', np.float64), ('y', np.int32), ('z', np.float64)])
+        testdata = np.zeros((100000,), dtype=dt)
+        testdata['x'] = np.arange(100000)
+        testdata['y'] = -np.arange(100000)
+        testdata['z'] = 0.5
+
+        ds = self.f.create_dataset('test', data=testdata)
+        for sl in (np.s_[5], np.s_[:3], np.s_[10:2000], np.s_[:]):
+            np.testing.assert_array_equal(ds['x', 'y', sl],
+                                          testdata[['x', 'y']][sl])
+            np.testing.assert_array_equal(ds['z', sl], testdata['z'][sl])
+
+        ds['z', :10] = np.arange(10)
+        ds['y', 10:] = 7
+        testdata['z'][:10] = np.arange(10)
+        testdata['y'][10:] = 7
+        np.testing.assert_array_equal(ds[...], testdata)
+
 
 class TestSubarray(BaseDataset):
     def test_write_list(self):
@@ -1464,6 +1612,25 @@ class TestAstype(BaseDataset):
         arr = dset.astype('f4')[:]
         self.assertArrayEqual(arr, np.arange(100, dtype='f4'))
 
+    def test_astype_byteorder(self):
+        """ Memory types for different byte orders aren't mixed up """
+        dset = self.f.create_dataset('x', (10,), dtype='i2')
+        dset[...] = np.arange(10)
+        for dt in ('<f8', '>f8', '<f8'):
+            arr = dset.astype(dt)[:]
+            self.assertEqual(arr.dtype, np.dtype(dt))
+            self.assertArrayEqual(arr, np.arange(10, dtype=dt))
+
+    def test_fast_reader(self):
+        """ Simple numeric datasets are read with the Cython reader """
+        for dt in ('<i4', '>f8'):
+            dset = self.f.create_dataset(dt, (10, 3), dtype=dt)
+            dset[...] = np.arange(30).reshape(10, 3)
+            self.assertTrue(dset._fast_read_ok)
+            arr = dset._fast_reader.read((slice(2, 4),))
+            self.assertEqual(arr.dtype, np.dtype(dt))
+            self.assertArrayEqual(arr, np.arange(6, 12, dtype=dt).reshape(2, 3))
+
 class TestScalarCompound(BaseDataset):
 
     """
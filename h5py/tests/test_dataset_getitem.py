@@ -553,6 +553,44 @@ class Test2DFloat(TestCase):
         self.assertNumpyBehavior(self.dset, self.data, np.s_[[]])
 
 
+class TestLongIndexList(TestCase):
+
+    """ Index lists long enough to be selected in several merged parts """
+
+    def setUp(self):
+        TestCase.setUp(self)
+        self.data = np.arange(3000).reshape((1000, 3)).astype('f')
+        self.dset = self.f.create_dataset('x', data=self.data)
+        # Runs of consecutive rows mixed with gaps
+        self.index = np.unique(np.r_[np.arange(0, 1000, 7), np.arange(100, 140)])
+
+    def test_rows(self):
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[self.index])
+
+    def test_rows_slice(self):
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[self.index, 1:])
+
+    def test_columns(self):
+        dset = self.f.create_dataset('y', data=self.data.T)
+        self.assertNumpyBehavior(dset, self.data.T, np.s_[:, self.index])
+
+    def test_mask_rows(self):
+        mask = np.zeros(1000, dtype=bool)
+        mask[self.index] = True
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[mask, :])
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[mask, 2])
+
+    def test_mask_wrong_length(self):
+        with self.assertRaises(TypeError):
+            self.dset[np.ones(999, dtype=bool), :]
+
+    def test_write(self):
+        block = -np.ones((len(self.index), 3), dtype='f')
+        self.dset[self.index] = block
+        self.data[self.index] = block
+        np.testing.assert_array_equal(self.dset[()], self.data)
+
+
 class TestVeryLargeArray(TestCase):
 
     def setUp(self):
@@ -304,8 +304,36 @@ class TestDrivers(TestCase):
         with self.assertRaises(ValueError):
             File(tf, 'w', driver='core')
 
-
-    # TODO: family driver tests
+    def test_family(self):
+        """ Family driver splits data across member files """
+        fname = self.mktemp(suffix='-%d.hdf5')
+        fid = File(fname, 'w', driver='family', memb_size=1024)
+        self.assertEqual(fid.driver, 'family')
+        fid['data'] = list(range(1024))
+        fid.close()
+        self.assertTrue(os.path.exists(fname % 1))
+        with File(fname, 'r', driver='family', memb_size=1024) as fid:
+            self.assertEqual(list(fid['data'][:]), list(range(1024)))
+
+    def test_shared_fapl(self):
+        """ Opens with identical driver settings reuse one access plist """
+        from h5py._hl.files import make_fapl
+        fapl = make_fapl('core', None, None, None, None, backing_store=False)
+        self.assertIs(fapl, make_fapl('core', None, None, None, None,
+                                      backing_store=False))
+        self.assertIsNot(fapl, make_fapl('core', None, None, None, None,
+                                         backing_store=True))
+        self.assertIsNot(fapl, make_fapl('core', None, None, None, None,
+                                         backing_store=False, block_size=1024))
+
+        # Re-registering a driver must not hand out the old plist
+        set_core = h5py._hl.files._drivers['core']
+        h5py.register_driver('core', lambda plist, **kw: set_core(plist, **kw))
+        try:
+            self.assertIsNot(fapl, make_fapl('core', None, None, None, None,
+                                             backing_store=False))
+        finally:
+            h5py.register_driver('core', set_core)
 
 
 @ut.skipUnless(h5py.version.hdf5_version_tuple < (1, 10, 2),
@@ -613,6 +641,15 @@ class TestClose(TestCase):
         with self.assertRaises(ValueError):
             fid.create_group('foo')
 
+    def test_closed_filename(self):
+        """ The filename of a closed file raises ValueError """
+        fname = self.mktemp()
+        fid = File(fname, 'w')
+        self.assertEqual(fid.filename, fname)
+        fid.close()
+        with self.assertRaises(ValueError):
+            fid.filename
+
     def test_close_multiple_default_driver(self):
         fname = self.mktemp()
         f = h5py.File(fname, 'w')
@@ -94,3 +94,23 @@ def test_filters_available():
     assert 'gzip' in h5py.filters.encode
     assert 'lzf' in h5py.filters.decode
     assert 'lzf' in h5py.filters.encode
+
+
+@pytest.mark.parametrize('shape, typesize, chunks', [
+    ((1000, 2000, 30), 8, (63, 125, 2)),
+    ((100,), 4, (100,)),
+    ((10**6,), 1, (15625,)),
+    ((0, 100), 4, (128, 25)),     # Extendable axis guessed as 1024
+    ((3,), 2**21, (1,)),          # Element larger than the maximum chunk
+    ((100, 0), 0, (100, 1024)),   # Zero-size elements
+    ((4096, 4096), 8, (64, 128)), # Last axis kept larger
+])
+def test_guess_chunk(shape, typesize, chunks):
+    assert h5py.filters.guess_chunk(shape, None, typesize) == chunks
+
+
+def test_guess_chunk_numpy_shape():
+    shape = tuple(np.array([100000, 3000], dtype=np.uint64))
+    chunks = h5py.filters.guess_chunk(shape, None, 8)
+    assert chunks == h5py.filters.guess_chunk((100000, 3000), None, 8)
+    assert all(type(c) is int for c in chunks)
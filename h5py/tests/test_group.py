@@ -94,6 +94,19 @@ class TestCreate(BaseGroup):
         self.assertEqual(group.name, name)
         self.assertEqual(group.id.links.get_info(name.encode('utf8')).cset, h5t.CSET_ASCII)
 
+    def test_unicode_mixed(self):
+        """ ASCII and UTF-8 names created in turn keep their own encoding """
+        ascii_name = u"/ascii"
+        utf8_name = u"/utf8" + chr(0x4500)
+        for i in range(2):
+            self.f.create_group(ascii_name + str(i))
+            self.f.create_group(utf8_name + str(i))
+        for i in range(2):
+            ainfo = self.f.id.links.get_info((ascii_name + str(i)).encode('utf8'))
+            uinfo = self.f.id.links.get_info((utf8_name + str(i)).encode('utf8'))
+            self.assertEqual(ainfo.cset, h5t.CSET_ASCII)
+            self.assertEqual(uinfo.cset, h5t.CSET_UTF8)
+
     def test_appropriate_low_level_id(self):
         " Binding a group to a non-group identifier fails with ValueError "
         dset = self.f.create_dataset('foo', [1])
@@ -165,6 +178,12 @@ class TestRequire(BaseGroup):
         with self.assertRaises(TypeError):
             self.f.require_group('foo')
 
+    def test_require_dangling_softlink(self):
+        """ A broken soft link in the way can't be replaced by a new group """
+        self.f['foo'] = h5py.SoftLink('/mongoose')
+        with self.assertRaises(ValueError):
+            self.f.require_group('foo')
+
     def test_intermediate_create_dataset(self):
         """ Intermediate is created if it doesn't exist """
         dt = h5py.string_dtype()
@@ -284,6 +303,18 @@ class TestOpen(BaseGroup):
         with self.assertRaises(TypeError):
             self.f[...]
 
+    def test_dataset_readonly(self):
+        """ Datasets opened from a read-only file are flagged as such """
+        self.f.create_group('foo').create_dataset('x', (10,))
+        self.assertFalse(self.f['foo']['x']._readonly)
+        fname = self.f.filename
+        self.f.close()
+
+        with File(fname, 'r') as f:
+            grp = f['foo']
+            self.assertTrue(grp['x']._readonly)
+            self.assertTrue(grp['x']._readonly)
+
     # TODO: check that regionrefs also work with __getitem__
 
 class TestRepr(BaseGroup):
@@ -386,6 +417,10 @@ class TestContains(BaseGroup):
         self.assertNotIn('/grp/soft/something', self.f)
         self.assertIn('/grp/external', self.f)
         self.assertNotIn('/grp/external/something', self.f)
+        grp = self.f['grp']
+        self.assertIn('soft', grp)
+        self.assertIn('external', grp)
+        self.assertNotIn('mongoose', grp)
 
     def test_oddball_paths(self):
         """ Technically legitimate (but odd-looking) paths """
@@ -664,6 +699,26 @@ class TestVisit(TestCase):
         x = self.f.visititems(lambda x, y: (x,y))
         self.assertEqual(x, (self.groups[0], self.f[self.groups[0]]))
 
+    def test_visit_links(self):
+        """ Every link is visited, soft links included but not followed """
+        self.f['grp1/soft'] = SoftLink('/grp2')
+        self.f['grp2/data'] = 42
+        self.f['grp1/hard'] = self.f['grp2/data']
+        l = []
+        self.f.visit_links(l.append)
+        self.assertSameElements(l, self.groups + ['grp1/soft', 'grp1/hard', 'grp2/data'])
+        x = self.f.visit_links(lambda x: x)
+        self.assertEqual(x, self.groups[0])
+
+    def test_visititems_links(self):
+        """ Links are passed to the callable as link objects """
+        self.f['grp1/soft'] = SoftLink('/grp2')
+        l = {}
+        self.f.visititems_links(l.__setitem__)
+        self.assertSameElements(list(l), self.groups + ['grp1/soft'])
+        self.assertIsInstance(l['grp1'], HardLink)
+        self.assertEqual(l['grp1/soft'].path, '/grp2')
+
 class TestSoftLinks(BaseGroup):
 
     """
@@ -870,6 +925,10 @@ class TestCopy(TestCase):
         self.assertIsInstance(self.f2['/foo'], Group)
         self.assertArrayEqual(self.f2['foo/bar'], np.array([1,2,3]))
 
+        # A nested path is copied under its last name component
+        self.f1.copy('foo/bar', baz)
+        self.assertArrayEqual(baz['bar'], np.array([1,2,3]))
+
     @ut.skipIf(h5py.version.hdf5_version_tuple < (1,8,9),
                "Bug in HDF5<1.8.8 prevents copying open dataset")
     def test_copy_group_to_path(self):
@@ -1,7 +1,7 @@
 import pytest
 
 from .common import TestCase
-from h5py import File
+from h5py import File, h5o
 
 
 class SampleException(Exception):
@@ -19,3 +19,16 @@ class TestVisit(TestCase):
         with pytest.raises(SampleException, match='throwing exception'):
             fid.visititems(throwing)
         fid.close()
+
+    def test_visit_info(self):
+        """ Object info is filled in when requested """
+        fname = self.mktemp()
+        with File(fname, 'w') as fid:
+            fid.create_dataset('foo', (100,), dtype='uint8')
+            infos = {}
+
+            def record(name, info):
+                infos[name] = (info.type, info.rc, info.hdr.nmesgs > 0)
+
+            h5o.visit(fid.id, record, info=True)
+        self.assertEqual(infos, {b'foo': (h5o.TYPE_DATASET, 1, True)})
@@ -54,6 +54,23 @@ class TestLibver(TestCase):
         self.assertEqual((h5f.LIBVER_V18, h5f.LIBVER_V112),
                          plist.get_libver_bounds())
 
+class TestDC(TestCase):
+    '''
+    Feature: querying the filter pipeline of a dataset creation property list
+    '''
+    def test_get_all_filters(self):
+        '''get_all_filters matches get_filter for each index'''
+        dcpl = h5p.create(h5p.DATASET_CREATE)
+        self.assertEqual(dcpl.get_all_filters(), [])
+        dcpl.set_chunk((10,))
+        dcpl.set_shuffle()
+        dcpl.set_deflate(5)
+        dcpl.set_fletcher32()
+        filters = dcpl.get_all_filters()
+        self.assertEqual(len(filters), 3)
+        self.assertEqual(filters,
+                         [dcpl.get_filter(i) for i in range(dcpl.get_nfilters())])
+
 class TestDA(TestCase):
     '''
     Feature: setting/getting chunk cache size on a dataset access property list
@@ -70,6 +87,19 @@ class TestDA(TestCase):
                          dalist.get_chunk_cache())
 
 
+class TestDX(TestCase):
+    '''
+    Feature: setting/getting the buffer size on a dataset transfer property list
+    '''
+    def test_buffer(self):
+        '''test get/set type conversion buffer size '''
+        dxlist = h5p.create(h5p.DATASET_XFER)
+        self.assertEqual(dxlist.get_buffer(), 1024 * 1024)
+
+        dxlist.set_buffer(4096)
+        self.assertEqual(dxlist.get_buffer(), 4096)
+
+
 class TestFA(TestCase):
     '''
     Feature: setting/getting mdc config on a file access property list
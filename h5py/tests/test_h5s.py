@@ -0,0 +1,68 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2013 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+import unittest as ut
+
+from h5py import h5s, version
+
+from .common import TestCase
+
+
+@ut.skipIf(version.hdf5_version_tuple < (1, 10, 6),
+           'Requires HDF5 library >= 1.10.6')
+class TestCombineSelect(TestCase):
+
+    """
+        Feature: Combining and copying hyperslab selections
+    """
+
+    def setUp(self):
+        self.space = h5s.create_simple((10, 10))
+        self.space.select_hyperslab((0, 0), (2, 10))
+
+    def test_combine_hyperslab(self):
+        """ combine_hyperslab returns a new space, leaving the source alone """
+        combined = self.space.combine_hyperslab((5, 0), (3, 10))
+        self.assertEqual(combined.get_select_npoints(), 50)
+        self.assertEqual(self.space.get_select_npoints(), 20)
+
+        combined = self.space.combine_hyperslab((0, 0), (10, 5),
+                                                op=h5s.SELECT_AND)
+        self.assertEqual(combined.get_select_npoints(), 10)
+        self.assertEqual(self.space.get_select_npoints(), 20)
+
+    def test_combine_select(self):
+        """ combine_select merges two selections into a new space """
+        other = h5s.create_simple((10, 10))
+        other.select_hyperslab((1, 0), (3, 10))
+        combined = self.space.combine_select(other)
+        self.assertEqual(combined.get_select_npoints(), 40)
+        self.assertEqual(combined.get_select_bounds(), ((0, 0), (3, 9)))
+        self.assertEqual(self.space.get_select_npoints(), 20)
+        self.assertEqual(other.get_select_npoints(), 30)
+
+        combined = self.space.combine_select(other, h5s.SELECT_AND)
+        self.assertEqual(combined.get_select_npoints(), 10)
+
+    def test_modify_select(self):
+        """ modify_select combines another selection in place """
+        other = h5s.create_simple((10, 10))
+        other.select_hyperslab((8, 0), (2, 10))
+        self.space.modify_select(other)
+        self.assertEqual(self.space.get_select_npoints(), 40)
+        self.assertEqual(other.get_select_npoints(), 20)
+
+    def test_select_copy(self):
+        """ select_copy replaces a selection with a copy of another """
+        other = h5s.create_simple((10, 10))
+        other.select_hyperslab((4, 4), (2, 2))
+        self.space.select_copy(other)
+        self.assertEqual(self.space.get_select_bounds(), ((4, 4), (5, 5)))
+        other.select_none()
+        self.assertEqual(self.space.get_select_npoints(), 4)
@@ -62,8 +62,9 @@ class TestTypeFloatID(TestCase):
     def test_custom_float_promotion(self):
         """Custom floats are correctly promoted to standard floats on read."""
 
-        # This test uses the low-level API, so we need names as byte strings
-        test_filename = self.mktemp().encode()
+        # This test uses the low-level API, so we need names as byte strings.
+        # The file is kept in memory: nothing here needs it on disk.
+        test_filename = b'custom_float_promotion.h5'
         dataset = b'DS1'
         dataset2 = b'DS2'
         dataset3 = b'DS3'
@@ -98,8 +99,10 @@ class TestTypeFloatID(TestCase):
                             3.36513040e-10,   1.02545528e-10,   1.28784450e-09,
                             4.06089384e-10]], dtype=np.float32)
 
-        # Create a new file using the default properties.
-        fid = h5py.h5f.create(test_filename)
+        # Create a new in-memory file.
+        fapl = h5py.h5p.create(h5py.h5p.FILE_ACCESS)
+        fapl.set_fapl_core(backing_store=False)
+        fid = h5py.h5f.create(test_filename, fapl=fapl)
         # Create the dataspace.  No maximum size parameter needed.
         space = h5py.h5s.create_simple(dims)
 
@@ -155,12 +158,11 @@ class TestTypeFloatID(TestCase):
         dset = h5py.h5d.create(fid, dataset5, h5t.NATIVE_LDOUBLE, space)
         dset.write(h5py.h5s.ALL, h5py.h5s.ALL, wdata2)
 
-        # Explicitly close and release resources.
+        # Explicitly release resources; the file itself must stay open.
         del space
         del dset
-        del fid
 
-        f = h5py.File(test_filename, 'r')
+        f = h5py.File(fid)
 
         # ebias promotion to float32
         values = f[dataset][:]
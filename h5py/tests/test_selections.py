@@ -132,3 +132,42 @@ class TestSelection(BaseSelection):
         # args is a single Selection instance, but args shape doesn't match Shape
         with self.assertRaises(TypeError):
             sel.select((100,), st3, dset)
+
+class TestPointSelection(TestCase):
+
+    """ Point selections made from coordinate arrays """
+
+    def test_single_point(self):
+        point = np.array([3, 4], dtype='u8')
+        st = sel.PointSelection((10, 10))
+        st.set(point)
+        self.assertEqual(st.nselect, 1)
+        # The caller's array isn't reshaped
+        self.assertEqual(point.shape, (2,))
+
+    def test_no_points(self):
+        st = sel.PointSelection((10, 10))
+        st.set(np.zeros((0, 2), dtype='u8'))
+        self.assertEqual(st.nselect, 0)
+
+
+class TestGuessShape(TestCase):
+
+    """ Shapes of selections made directly on a dataspace """
+
+    def test_regular_hyperslab(self):
+        sid = h5py.h5s.create_simple((20, 30, 40))
+        sid.select_hyperslab((1, 0, 5), (3, 1, 4), stride=(5, 1, 8), block=(2, 1, 3))
+        self.assertEqual(sel.guess_shape(sid), (6, 1, 12))
+
+    def test_rectangular_union(self):
+        sid = h5py.h5s.create_simple((20, 30))
+        sid.select_hyperslab((0, 0), (2, 5))
+        sid.select_hyperslab((5, 0), (3, 5), op=h5py.h5s.SELECT_OR)
+        self.assertEqual(sel.guess_shape(sid), (5, 5))
+
+    def test_irregular_hyperslabs(self):
+        sid = h5py.h5s.create_simple((20, 30))
+        sid.select_hyperslab((0, 0), (2, 5))
+        sid.select_hyperslab((5, 0), (3, 4), op=h5py.h5s.SELECT_OR)
+        self.assertEqual(sel.guess_shape(sid), (22,))
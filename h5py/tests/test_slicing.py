@@ -73,6 +73,19 @@ class TestSingleElement(BaseSlicing):
         self.assertEqual(dset[0], v[0])
         self.assertIsInstance(dset[0], np.void)
 
+    def test_write_numbers(self):
+        """ Assigning numbers one element at a time converts each value """
+        dset = self.f.create_dataset('x', (4,), dtype='i2')
+        dset[0] = 1
+        dset[1] = 2.7
+        dset[2] = np.float32(-3)
+        dset[3] = True
+        self.assertArrayEqual(dset[...], np.array([1, 2, -3, 1], dtype='i2'))
+
+        dset[1:3] = 5
+        self.assertArrayEqual(dset[...], np.array([1, 5, 5, 1], dtype='i2'))
+
+
 class TestObjectIndex(BaseSlicing):
 
     """
@@ -146,6 +159,36 @@ class TestSimpleSlicing(TestCase):
         with self.assertRaises(TypeError):
             dset[:, 1] = x
 
+    def test_write_broadcast(self):
+        """ Broadcast writes match NumPy, whether or not they fit a chunk """
+        for i, chunks in enumerate([(20, 6, 4), (5, 3, 2), None]):
+            dset = self.f.create_dataset('b%d' % i, (20, 6, 4), 'i4',
+                                         chunks=chunks)
+            arr = np.zeros((20, 6, 4), 'i4')
+            for sel, val in [
+                (np.s_[...], np.arange(4)),
+                (np.s_[:, 2], np.arange(4).reshape(1, 4)),
+                (np.s_[3:9, :, 1], np.arange(6) + 10),
+                (np.s_[::2, 1:5, :], np.arange(16).reshape(4, 4) + 20),
+                (np.s_[..., 0], np.arange(20).reshape(20, 1) + 40),
+                (np.s_[7], np.ones((1, 1, 4)) * 70),
+            ]:
+                dset[sel] = val
+                arr[sel] = val
+                self.assertArrayEqual(dset[...], arr)
+
+    def test_write_scalar_large(self):
+        """ Scalar fills bigger than the intermediate buffer """
+        for i, chunks in enumerate([(8, 60, 40), None]):
+            dset = self.f.create_dataset('s%d' % i, (80, 60, 40), 'f8',
+                                         chunks=chunks)
+            arr = np.zeros((80, 60, 40))
+            for sel, val in [(np.s_[...], 1.5), (np.s_[3:, 5, :], 2.5),
+                             (np.s_[:, ::2], 3.5)]:
+                dset[sel] = val
+                arr[sel] = val
+                self.assertArrayEqual(dset[...], arr)
+
 class TestArraySlicing(BaseSlicing):
 
     """
@@ -270,6 +313,19 @@ class TestZeroLengthSlicing(BaseSlicing):
             self.assertIsInstance(out, np.ndarray)
             self.assertEqual(out.shape, (0,)+shape[1:])
 
+    def test_slice_of_length_zero_compound(self):
+        """ Repeated empty slices of a compound dataset are separate arrays """
+        dt = np.dtype([('a', 'i4'), ('b', 'f8')])
+        dset = self.f.create_dataset('x', data=np.zeros((4, 3), dtype=dt))
+        out1 = dset[1:1]
+        out2 = dset[:, 2:2]
+        self.assertEqual(out1.shape, (0, 3))
+        self.assertEqual(out2.shape, (4, 0))
+        self.assertEqual(out1.dtype, dt)
+        self.assertIsNot(out1, out2)
+        out1.shape = (3, 0)
+        self.assertEqual(dset[1:1].shape, (0, 3))
+
 class TestFieldNames(BaseSlicing):
 
     """
@@ -14,6 +14,7 @@ import sys
 import os
 import os.path as op
 from pathlib import Path
+import multiprocessing
 import subprocess
 
 import api_gen
@@ -66,6 +67,18 @@ if sys.platform.startswith('win'):
     ])
 
 
+def build_jobs():
+    """Number of parallel jobs to use for Cython and C compilation
+
+    Set the environment variable H5PY_BUILD_JOBS to override the default of
+    one job per CPU.
+    """
+    jobs = os.environ.get('H5PY_BUILD_JOBS')
+    if jobs:
+        return max(int(jobs), 1)
+    return os.cpu_count() or 1
+
+
 class h5py_build_ext(build_ext):
 
     """
@@ -86,7 +99,8 @@ class h5py_build_ext(build_ext):
         """
         import numpy
 
-        settings = COMPILER_SETTINGS.copy()
+        # Copy the lists too, so the module-level defaults aren't modified
+        settings = {k: list(v) for k, v in COMPILER_SETTINGS.items()}
 
         settings['include_dirs'][:0] = config.hdf5_includedirs
         settings['library_dirs'][:0] = config.hdf5_libdirs
@@ -110,8 +124,13 @@ class h5py_build_ext(build_ext):
 
         def make_extension(module):
             sources = [localpath('h5py', module + '.pyx')] + EXTRA_SRC.get(module, [])
-            settings['libraries'] += EXTRA_LIBRARIES.get(module, [])
-            return Extension('h5py.' + module, sources, **settings)
+            ext_settings = settings
+            if module in EXTRA_LIBRARIES:
+                # Only link extra libraries into the module which needs them
+                ext_settings = dict(settings, libraries=(
+                    settings['libraries'] + EXTRA_LIBRARIES[module]
+                ))
+            return Extension('h5py.' + module, sources, **ext_settings)
 
         return [make_extension(m) for m in MODULES]
 
@@ -166,13 +185,25 @@ DEF CYTHON_BUILD_VERSION = '%(cython_version)s'
         }
         write_if_changed(config_file, s)
 
-        # Run Cython
+        # Run Cython. cythonize() farms modules out to a process pool, which
+        # re-imports setup.py in each worker unless processes are forked.
+        # Check the start method without fixing it, so it can still be set
+        # by other build steps; if unset, the platform default applies.
+        start_method = (multiprocessing.get_start_method(allow_none=True)
+                        or multiprocessing.get_all_start_methods()[0])
+        jobs = build_jobs()
+        if jobs == 1 or start_method != 'fork':
+            jobs = 0
         print("Executing cythonize()")
         self.extensions = cythonize(self._make_extensions(config),
                                     force=config.changed() or self.force,
+                                    nthreads=jobs,
                                     language_level=3)
 
-        # Perform the build
+        # Perform the build, compiling extensions in parallel unless -j was
+        # given on the command line
+        if not self.parallel and build_jobs() > 1:
+            self.parallel = build_jobs()
         build_ext.run(self)
 
         # Record the configuration we built